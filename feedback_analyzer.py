@@ -5,41 +5,215 @@ A Python script that analyzes customer feedback and categorizes it into
 sentiment categories: Happy, Sad, and Mild.
 """
 
+import argparse
+import codecs
 import csv
+import os
+import re
+import sqlite3
 import sys
 import traceback
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from hashlib import blake2b
+from operator import attrgetter
 from pathlib import Path
-from typing import List
-from textblob import TextBlob
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
+
+
+# Category labels, interned so every result shares the same string objects
+HAPPY = sys.intern("Happy")
+SAD = sys.intern("Sad")
+MILD = sys.intern("Mild")
+_VALID_CATEGORIES = frozenset((HAPPY, SAD, MILD))
+
+# Labels for the one-byte category codes used by columnar results
+CATEGORIES = (HAPPY, SAD, MILD)
+
+# Maps any string equal to a category label to the shared constant
+_CANONICAL_CATEGORIES = {category: category for category in CATEGORIES}
+
+# Read-only (min, max) polarity range for each category
+_CATEGORY_THRESHOLDS = MappingProxyType({
+    HAPPY: (0.1, 1.0),
+    SAD: (-1.0, -0.1),
+    MILD: (-0.1, 0.1)
+})
+
+# Finds the first non-whitespace character without copying the string
+_HAS_NON_WHITESPACE = re.compile(r"\S").search
+
+# Finds characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules)
+_NEEDS_CSV_QUOTING = re.compile(r'[",\r\n]').search
+
+# Input file buffer size, large enough that big CSV inputs are read in few syscalls
+_READ_BUFFER_SIZE = 1 << 20
+
+# Number of leading bytes inspected to choose an input file's encoding
+_ENCODING_SAMPLE_SIZE = 1 << 16
+
+# Output file buffer size, large enough that big exports are written in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Pre-rendered header row of exported CSV files, with csv.writer's line terminator
+_CSV_HEADER = "feedback,category,sentiment_score\r\n"
+
+# Row template for the results table, formatted once per result
+_format_table_row = "{:<50} | {:<10} | {:<10.3f}".format
+
+
+def _csv_field(value: object) -> str:
+    """Quote a CSV field the way csv.writer's default dialect would.
+    
+    As with csv.writer, None is written as an empty field and any other
+    non-string value as its str().
+    
+    Args:
+        value: The field value to write
+        
+    Returns:
+        The value as a string, wrapped in quotes with embedded quotes doubled
+        if it contains a comma, quote, or line break
+    """
+    if value is None:
+        return ""
+    if type(value) is not str:
+        value = str(value)
+    if _NEEDS_CSV_QUOTING(value) is None:
+        return value
+    return '"' + value.replace('"', '""') + '"'
+
+
+def pattern_sentiment(text: str):
+    """Score text with the pattern.en lexicon that backs TextBlob.
+    
+    Importing textblob also imports NLTK, which dominates start-up time, so
+    the import is deferred to the first call. That call then rebinds this
+    name to textblob's scorer, so later calls go to it directly.
+    
+    Args:
+        text: The text to score
+        
+    Returns:
+        (polarity, subjectivity) tuple
+    """
+    global pattern_sentiment
+    from textblob.en import sentiment
+    pattern_sentiment = sentiment
+    return sentiment(text)
 
 
 @dataclass
 class FeedbackResult:
-    """Represents the result of analyzing a single feedback entry."""
+    """Represents the result of analyzing a single feedback entry.
+    
+    Construction is unchecked so the analysis pipeline, which only produces
+    valid categories and scores, stays cheap. Use checked() for values that
+    come from outside the pipeline.
+    """
+    __slots__ = ('feedback_text', 'category', 'sentiment_score')
+    
     feedback_text: str
     category: str  # "Happy", "Sad", or "Mild"
     sentiment_score: float
     
-    def __post_init__(self):
-        """Validate category and sentiment score after initialization."""
-        # Validate category is one of the three allowed values
-        if self.category not in ["Happy", "Sad", "Mild"]:
-            raise ValueError(f"Category must be 'Happy', 'Sad', or 'Mild', got '{self.category}'")
+    @classmethod
+    def checked(cls, feedback_text: str, category: str, sentiment_score: float) -> 'FeedbackResult':
+        """Create a FeedbackResult after validating category and sentiment score.
+        
+        Args:
+            feedback_text: The original feedback text
+            category: The sentiment category ("Happy", "Sad", or "Mild")
+            sentiment_score: The sentiment polarity score
+            
+        Returns:
+            The validated FeedbackResult, with its category replaced by the
+            HAPPY, SAD, or MILD constant it equals (str subclasses such as
+            str-based Enum members are accepted)
+            
+        Raises:
+            ValueError: If the category or sentiment score is invalid
+        """
+        # Validate category is one of the three allowed values; str.__str__
+        # takes the plain string value of subclasses, and the isinstance check
+        # keeps unhashable values out of the lookup
+        canonical = (
+            _CANONICAL_CATEGORIES.get(str.__str__(category))
+            if isinstance(category, str) else None
+        )
+        if canonical is None:
+            raise ValueError(f"Category must be 'Happy', 'Sad', or 'Mild', got '{category}'")
         
         # Validate sentiment score is in valid range
-        if not (-1.0 <= self.sentiment_score <= 1.0):
-            raise ValueError(f"Sentiment score must be between -1.0 and 1.0, got {self.sentiment_score}")
+        if not (-1.0 <= sentiment_score <= 1.0):
+            raise ValueError(f"Sentiment score must be between -1.0 and 1.0, got {sentiment_score}")
+        
+        return cls(feedback_text, canonical, sentiment_score)
+
+
+@dataclass
+class FeedbackResults:
+    """Analysis results for a set of feedback entries, stored as parallel columns.
+    
+    Summaries and exports each need only one or two fields, so they read the
+    columns directly instead of walking per-entry objects. Categories are
+    stored as one-byte codes indexing CATEGORIES, so counting them is a C-level
+    scan. Scores are kept in an array('d') of unboxed doubles rather than a
+    list of float objects. Indexing and iteration yield FeedbackResult rows
+    for code that expects them.
+    """
+    feedback_texts: List[str]
+    category_codes: bytearray
+    sentiment_scores: array
+    
+    def __len__(self) -> int:
+        return len(self.feedback_texts)
+    
+    def __getitem__(self, index: int) -> FeedbackResult:
+        return FeedbackResult(
+            self.feedback_texts[index],
+            CATEGORIES[self.category_codes[index]],
+            self.sentiment_scores[index]
+        )
+    
+    def __iter__(self) -> Iterator[FeedbackResult]:
+        return map(FeedbackResult, self.feedback_texts, self.iter_categories(), self.sentiment_scores)
+    
+    @property
+    def categories(self) -> List[str]:
+        """Category labels for all results, decoded from their codes."""
+        return list(self.iter_categories())
+    
+    def iter_categories(self) -> Iterator[str]:
+        """Iterate over category labels without materializing a list."""
+        return map(CATEGORIES.__getitem__, self.category_codes)
+    
+    def count(self, category: str) -> int:
+        """Count the results in a given category ("Happy", "Sad", or "Mild")."""
+        return self.category_codes.count(CATEGORIES.index(category))
 
 
 @dataclass
 class AnalysisSummary:
     """Represents summary statistics for a set of feedback analysis results."""
+    __slots__ = ('total_count', 'happy_count', 'sad_count', 'mild_count')
+    
     total_count: int
     happy_count: int
     sad_count: int
     mild_count: int
     
+    # Count field getters by lowercase category name
+    _COUNT_GETTERS = {
+        'happy': attrgetter('happy_count'),
+        'sad': attrgetter('sad_count'),
+        'mild': attrgetter('mild_count')
+    }
+    
     def get_percentage(self, category: str) -> float:
         """Calculate the percentage of feedback in a given category.
         
@@ -52,7 +226,7 @@ class AnalysisSummary:
         if self.total_count == 0:
             return 0.0
         
-        count = getattr(self, f"{category.lower()}_count")
+        count = AnalysisSummary._COUNT_GETTERS[category.lower()](self)
         return (count / self.total_count) * 100
 
 
@@ -69,14 +243,101 @@ class FeedbackLoader:
         Returns:
             True if feedback is valid (non-empty and not just whitespace), False otherwise
         """
-        return feedback is not None and feedback.strip() != ""
+        return feedback is not None and _HAS_NON_WHITESPACE(feedback) is not None
+    
+    @staticmethod
+    def _open_input(file_path: str, mode: str = 'r', **open_kwargs):
+        """Open an input file for reading, reporting a missing file with remediation text.
+        
+        open() detects the missing file itself, so no separate existence check
+        (and extra stat call) is made before opening.
+        
+        Args:
+            file_path: Path to the input file
+            mode: File mode, 'r' for text or 'rb' for binary (default: 'r')
+            **open_kwargs: Extra keyword arguments passed to open()
+            
+        Returns:
+            The open file
+            
+        Raises:
+            FileNotFoundError: If the specified file does not exist
+        """
+        try:
+            return open(file_path, mode, **open_kwargs)
+        except (FileNotFoundError, NotADirectoryError):
+            # A path through a regular file cannot exist either
+            pass
+        except ValueError:
+            # Neither can a path with an embedded null byte; other argument
+            # errors are reported as they are
+            path = os.fspath(file_path)
+            if ('\0' if isinstance(path, str) else b'\0') not in path:
+                raise
+        raise FileNotFoundError(
+            f"Input file not found: {file_path}\n"
+            f"Remediation: Please check that the file path is correct and the file exists."
+        )
+    
+    @staticmethod
+    def _detect_encoding(file_path: str) -> str:
+        """Choose the encoding of an input file from its first bytes.
+        
+        A byte order mark identifies UTF-8, UTF-16 and UTF-32 files. Otherwise
+        the sample is checked as UTF-8, so a file that is clearly not UTF-8
+        is read once as latin-1 instead of failing partway through a UTF-8
+        read and being read again.
+        
+        Args:
+            file_path: Path to the input file
+            
+        Returns:
+            'utf-32', 'utf-8-sig' or 'utf-16' for files starting with a byte
+            order mark, 'utf-8' if the sample is valid UTF-8, otherwise 'latin-1'
+            
+        Raises:
+            FileNotFoundError: If the specified file does not exist
+        """
+        with FeedbackLoader._open_input(file_path, 'rb') as f:
+            sample = f.read(_ENCODING_SAMPLE_SIZE)
+        
+        # UTF-32 first, since its little-endian BOM begins with UTF-16's
+        if sample.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+            return 'utf-32'
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        
+        # A sample cut off mid-character is not an error unless it is the whole file
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(
+                sample, final=len(sample) < _ENCODING_SAMPLE_SIZE
+            )
+        except UnicodeDecodeError:
+            return 'latin-1'
+        return 'utf-8'
     
     @staticmethod
-    def load_from_file(file_path: str) -> List[str]:
+    def _split_feedback(text: str) -> List[str]:
+        """Split text into feedback entries, one per line.
+        
+        Args:
+            text: Text with one feedback entry per '\n'-terminated line
+            
+        Returns:
+            List of valid feedback strings (empty/whitespace entries filtered out)
+        """
+        # Strip each line once and keep the non-empty results
+        return [feedback for feedback in map(str.strip, text.split('\n')) if feedback]
+    
+    @staticmethod
+    def load_from_file(file_path: Union[str, os.PathLike, TextIO]) -> List[str]:
         """Load feedback from a text file (one entry per line).
         
         Args:
-            file_path: Path to the text file containing feedback
+            file_path: Path to the text file containing feedback, or an
+                already-open text stream, which is read as-is
             
         Returns:
             List of valid feedback strings (empty/whitespace entries filtered out)
@@ -84,39 +345,40 @@ class FeedbackLoader:
         Raises:
             FileNotFoundError: If the specified file does not exist
             PermissionError: If the file cannot be read due to permissions
-            UnicodeDecodeError: If the file contains invalid character encodings
+            UnicodeDecodeError: If the file contains invalid character encodings,
+                or does not match the encoding named by its byte order mark
         """
-        path = Path(file_path)
+        if hasattr(file_path, 'read'):
+            return FeedbackLoader._split_feedback(file_path.read())
         
-        if not path.exists():
-            raise FileNotFoundError(
-                f"Input file not found: {file_path}\n"
-                f"Remediation: Please check that the file path is correct and the file exists."
-            )
-        
-        feedback_list = []
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    if FeedbackLoader.validate_feedback(line):
-                        feedback_list.append(line.strip())
+            encoding = FeedbackLoader._detect_encoding(file_path)
+            if encoding == 'latin-1':
+                print(f"Warning: File does not start with valid UTF-8, reading it with latin-1 encoding...")
+            
+            # Read the whole file in one call; universal newlines mode has
+            # already normalized line endings to '\n'
+            with FeedbackLoader._open_input(file_path, encoding=encoding) as f:
+                text = f.read()
         except PermissionError:
             raise PermissionError(
                 f"Permission denied when reading file: {file_path}\n"
                 f"Remediation: Please check that you have read permissions for this file."
             )
         except UnicodeDecodeError as e:
-            # Try with a fallback encoding
-            print(f"Warning: UTF-8 decoding failed at line {line_num}, attempting with latin-1 encoding...")
+            if encoding != 'utf-8':
+                # The byte order mark named the encoding, so latin-1 would only misread it
+                raise UnicodeDecodeError(
+                    e.encoding, e.object, e.start, e.end,
+                    f"Failed to decode file {file_path} as {encoding}, the encoding named by its byte order mark.\n"
+                    f"Remediation: Please ensure the file is saved entirely in one encoding, preferably UTF-8."
+                )
+            
+            # Invalid bytes past the sampled start; try with a fallback encoding
+            print(f"Warning: UTF-8 decoding failed, attempting with latin-1 encoding...")
             try:
-                with open(path, 'r', encoding='latin-1') as f:
-                    for line_num, line in enumerate(f, 1):
-                        try:
-                            if FeedbackLoader.validate_feedback(line):
-                                feedback_list.append(line.strip())
-                        except Exception as line_error:
-                            print(f"Warning: Skipping line {line_num} due to encoding error: {line_error}")
-                            continue
+                with open(file_path, 'r', encoding='latin-1') as f:
+                    text = f.read()
             except Exception as fallback_error:
                 raise UnicodeDecodeError(
                     e.encoding, e.object, e.start, e.end,
@@ -124,14 +386,61 @@ class FeedbackLoader:
                     f"Remediation: Please ensure the file is saved with UTF-8 encoding."
                 )
         
-        return feedback_list
+        return FeedbackLoader._split_feedback(text)
+    
+    @staticmethod
+    def _read_csv_column(f, column_name: str, file_path: str) -> List[str]:
+        """Read the valid feedback entries from one column of an open CSV file.
+        
+        The column index is resolved once from the header row, so data rows
+        are read as plain lists instead of building a dict per row.
+        
+        Args:
+            f: Open text file positioned at the start of the CSV data
+            column_name: Name of the column containing feedback text
+            file_path: Path of the CSV file, used in error messages
+            
+        Returns:
+            List of valid feedback strings (empty/whitespace entries filtered out)
+            
+        Raises:
+            KeyError: If the specified column does not exist in the CSV
+            csv.Error: If the CSV file is malformed
+        """
+        reader = csv.reader(f)
+        try:
+            header = next(reader, None)
+            if header is None:
+                return []
+            
+            # Last occurrence wins for duplicated headers, as with csv.DictReader
+            columns = {name: idx for idx, name in enumerate(header)}
+            if column_name not in columns:
+                available_columns = ', '.join(header)
+                raise KeyError(
+                    f"Column '{column_name}' not found in CSV file: {file_path}\n"
+                    f"Available columns: {available_columns}\n"
+                    f"Remediation: Use --csv-column to specify the correct column name."
+                )
+            col = columns[column_name]
+            
+            # Rows too short to have the column are treated as empty entries
+            values = (row[col] for row in reader if len(row) > col)
+            return [feedback for feedback in map(str.strip, values) if feedback]
+        
+        except csv.Error as e:
+            raise csv.Error(
+                f"Malformed CSV file at line {reader.line_num}: {e}\n"
+                f"Remediation: Please check that the CSV file is properly formatted."
+            )
     
     @staticmethod
-    def load_from_csv(file_path: str, column_name: str = 'feedback') -> List[str]:
+    def load_from_csv(file_path: Union[str, os.PathLike, TextIO], column_name: str = 'feedback') -> List[str]:
         """Load feedback from a CSV file.
         
         Args:
-            file_path: Path to the CSV file containing feedback
+            file_path: Path to the CSV file containing feedback, or an
+                already-open text stream, which is read as-is
             column_name: Name of the column containing feedback text (default: 'feedback')
             
         Returns:
@@ -142,43 +451,22 @@ class FeedbackLoader:
             PermissionError: If the file cannot be read due to permissions
             KeyError: If the specified column does not exist in the CSV
             csv.Error: If the CSV file is malformed
+            UnicodeDecodeError: If the file does not match the encoding named
+                by its byte order mark
         """
-        path = Path(file_path)
-        
-        if not path.exists():
-            raise FileNotFoundError(
-                f"Input file not found: {file_path}\n"
-                f"Remediation: Please check that the file path is correct and the file exists."
+        if hasattr(file_path, 'read'):
+            return FeedbackLoader._read_csv_column(
+                file_path, column_name, getattr(file_path, 'name', '<stream>')
             )
         
-        feedback_list = []
         try:
-            with open(path, 'r', encoding='utf-8', newline='') as f:
-                try:
-                    reader = csv.DictReader(f)
-                    
-                    # Check if column exists by reading first row
-                    first_row = True
-                    for row_num, row in enumerate(reader, 1):
-                        if first_row:
-                            if column_name not in row:
-                                available_columns = ', '.join(row.keys())
-                                raise KeyError(
-                                    f"Column '{column_name}' not found in CSV file: {file_path}\n"
-                                    f"Available columns: {available_columns}\n"
-                                    f"Remediation: Use --csv-column to specify the correct column name."
-                                )
-                            first_row = False
-                        
-                        feedback = row[column_name]
-                        if FeedbackLoader.validate_feedback(feedback):
-                            feedback_list.append(feedback.strip())
-                
-                except csv.Error as e:
-                    raise csv.Error(
-                        f"Malformed CSV file at line {reader.line_num}: {e}\n"
-                        f"Remediation: Please check that the CSV file is properly formatted."
-                    )
+            encoding = FeedbackLoader._detect_encoding(file_path)
+            if encoding == 'latin-1':
+                print(f"Warning: File does not start with valid UTF-8, reading it with latin-1 encoding...")
+            
+            with FeedbackLoader._open_input(file_path, encoding=encoding, newline='',
+                                            buffering=_READ_BUFFER_SIZE) as f:
+                feedback_list = FeedbackLoader._read_csv_column(f, column_name, file_path)
         
         except PermissionError:
             raise PermissionError(
@@ -186,30 +474,22 @@ class FeedbackLoader:
                 f"Remediation: Please check that you have read permissions for this file."
             )
         except UnicodeDecodeError as e:
-            # Try with a fallback encoding
+            if encoding != 'utf-8':
+                # The byte order mark named the encoding, so latin-1 would only misread it
+                raise UnicodeDecodeError(
+                    e.encoding, e.object, e.start, e.end,
+                    f"Failed to decode CSV file {file_path} as {encoding}, the encoding named by its byte order mark.\n"
+                    f"Remediation: Please ensure the file is saved entirely in one encoding, preferably UTF-8."
+                )
+            
+            # Invalid bytes past the sampled start; try with a fallback encoding
             print(f"Warning: UTF-8 decoding failed, attempting with latin-1 encoding...")
             try:
-                with open(path, 'r', encoding='latin-1', newline='') as f:
-                    reader = csv.DictReader(f)
-                    first_row = True
-                    for row_num, row in enumerate(reader, 1):
-                        try:
-                            if first_row:
-                                if column_name not in row:
-                                    available_columns = ', '.join(row.keys())
-                                    raise KeyError(
-                                        f"Column '{column_name}' not found in CSV file: {file_path}\n"
-                                        f"Available columns: {available_columns}\n"
-                                        f"Remediation: Use --csv-column to specify the correct column name."
-                                    )
-                                first_row = False
-                            
-                            feedback = row[column_name]
-                            if FeedbackLoader.validate_feedback(feedback):
-                                feedback_list.append(feedback.strip())
-                        except Exception as line_error:
-                            print(f"Warning: Skipping row {row_num} due to encoding error: {line_error}")
-                            continue
+                with open(file_path, 'r', encoding='latin-1', newline='',
+                          buffering=_READ_BUFFER_SIZE) as f:
+                    feedback_list = FeedbackLoader._read_csv_column(f, column_name, file_path)
+            except (KeyError, csv.Error):
+                raise
             except Exception as fallback_error:
                 raise UnicodeDecodeError(
                     e.encoding, e.object, e.start, e.end,
@@ -220,13 +500,151 @@ class FeedbackLoader:
         return feedback_list
 
 
+class SentimentCache:
+    """Persistent cache of polarity scores, stored in a SQLite file.
+    
+    Entries are keyed by a 16-byte BLAKE2b digest of the feedback text, so
+    repeated runs over overlapping feedback only score entries they have
+    not seen before. The file records which scorer produced its scores;
+    when that changes (a new cache layout or textblob release), the stored
+    scores are discarded rather than reused.
+    """
+    
+    # Stay under SQLite's default limit on parameters per statement
+    _LOOKUP_BATCH_SIZE = 900
+    
+    # Bump when the key or score format changes
+    _SCHEMA_VERSION = 1
+    
+    def __init__(self, path: str):
+        """Open (or create) the cache file.
+        
+        Args:
+            path: Path to the SQLite cache file
+            
+        Raises:
+            sqlite3.Error: If the file cannot be opened or is not a cache database
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        try:
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS cache (h BLOB PRIMARY KEY, score REAL NOT NULL)"
+                )
+                columns = [row[1] for row in self._connection.execute("PRAGMA table_info(cache)")]
+                if columns != ['h', 'score']:
+                    raise sqlite3.DatabaseError(
+                        f"Table 'cache' has columns {columns}, expected ['h', 'score']"
+                    )
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+                row = self._connection.execute(
+                    "SELECT value FROM meta WHERE name = 'scorer'"
+                ).fetchone()
+                scorer = SentimentCache.scorer_version()
+                if row is None or row[0] != scorer:
+                    self._connection.execute("DELETE FROM cache")
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO meta (name, value) VALUES ('scorer', ?)", (scorer,)
+                    )
+        except sqlite3.Error:
+            self._connection.close()
+            raise
+    
+    @staticmethod
+    def scorer_version() -> str:
+        """Identify the scorer whose results the cache holds.
+        
+        Returns:
+            The cache schema version combined with the installed textblob version
+        """
+        import textblob
+        return f"{SentimentCache._SCHEMA_VERSION}/textblob-{textblob.__version__}"
+    
+    def __enter__(self) -> 'SentimentCache':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+    
+    @staticmethod
+    def key(feedback: str) -> bytes:
+        """Hash feedback text into its cache key.
+        
+        Args:
+            feedback: The feedback string
+            
+        Returns:
+            16-byte BLAKE2b digest of the UTF-8 encoded text
+        """
+        return blake2b(feedback.encode('utf-8'), digest_size=16).digest()
+    
+    def get_many(self, feedbacks: List[str]) -> dict:
+        """Look up cached scores for a list of feedback entries.
+        
+        Args:
+            feedbacks: The feedback strings to look up
+            
+        Returns:
+            Dictionary mapping each cached feedback string to its score;
+            entries not in the cache are omitted
+        """
+        feedback_by_key = {SentimentCache.key(feedback): feedback for feedback in feedbacks}
+        keys = list(feedback_by_key)
+        found = {}
+        for start in range(0, len(keys), SentimentCache._LOOKUP_BATCH_SIZE):
+            batch = keys[start:start + SentimentCache._LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            for key, score in self._connection.execute(
+                f"SELECT h, score FROM cache WHERE h IN ({placeholders})", batch
+            ):
+                found[feedback_by_key[key]] = score
+        return found
+    
+    def put_many(self, feedbacks: List[str], scores: List[float]) -> None:
+        """Store scores for a list of feedback entries.
+        
+        Args:
+            feedbacks: The feedback strings that were scored
+            scores: Their polarity scores, in the same order
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO cache (h, score) VALUES (?, ?)",
+                zip(map(SentimentCache.key, feedbacks), scores)
+            )
+    
+    def close(self) -> None:
+        """Close the cache file."""
+        self._connection.close()
+
+
 class SentimentAnalyzer:
     """Analyzes sentiment and calculates polarity scores for feedback text."""
     
     @staticmethod
+    def warmup() -> None:
+        """Load the sentiment lexicon now rather than on the first analysis.
+        
+        pattern.en parses its XML lexicon lazily on first use. Calling this up
+        front moves that one-off cost out of the first analyzed entry, and,
+        as a process pool initializer, out of each worker's first chunk.
+        """
+        pattern_sentiment("warmup")
+    
+    @staticmethod
+    @lru_cache(maxsize=65536)
     def get_polarity_score(feedback: str) -> float:
         """Calculate the polarity score for feedback text.
         
+        Scores are computed with the pattern.en lexicon that backs TextBlob's
+        default PatternAnalyzer, without building a TextBlob per entry.
+        Results are memoized per feedback string, since feedback datasets
+        often repeat short entries; call get_polarity_score.cache_clear()
+        to release the cache.
+        
         Args:
             feedback: The feedback string to analyze
             
@@ -237,8 +655,7 @@ class SentimentAnalyzer:
             Exception: If TextBlob encounters an error during analysis
         """
         try:
-            blob = TextBlob(feedback)
-            return blob.sentiment.polarity
+            return pattern_sentiment(feedback)[0]
         except Exception as e:
             # Log the error and re-raise with more context
             raise Exception(
@@ -265,23 +682,84 @@ class SentimentAnalyzer:
         """
         # Even for short feedback, TextBlob can provide meaningful sentiment analysis
         return SentimentAnalyzer.get_polarity_score(feedback)
+    
+    @staticmethod
+    def analyze_batch(feedbacks: List[str], workers: Optional[int] = 1,
+                      cache: Optional[SentimentCache] = None) -> List[float]:
+        """Analyze sentiment for a list of feedback entries in a single pass.
+        
+        With more than one worker, the batch is split into chunks that are
+        scored in separate processes, since analysis is CPU-bound and entries
+        are independent. Repeated entries are scored once and their score is
+        copied to every occurrence, as the workers do not share a score cache.
+        
+        With a SentimentCache, only entries missing from the cache are
+        analyzed, and their scores are added to it.
+        
+        Args:
+            feedbacks: The feedback strings to analyze
+            workers: Number of worker processes (default: 1, analyze in the
+                current process; None: one per CPU)
+            cache: Optional persistent cache of previously computed scores
+            
+        Returns:
+            Polarity scores in the same order as the input
+            
+        Raises:
+            Exception: If any entry fails analysis
+        """
+        if cache is not None:
+            scores = cache.get_many(feedbacks)
+            misses = [feedback for feedback in dict.fromkeys(feedbacks) if feedback not in scores]
+            if misses:
+                miss_scores = SentimentAnalyzer.analyze_batch(misses, workers)
+                cache.put_many(misses, miss_scores)
+                scores.update(zip(misses, miss_scores))
+            return [scores[feedback] for feedback in feedbacks]
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1 or len(feedbacks) <= 1:
+            score = SentimentAnalyzer.get_polarity_score
+            return [score(feedback) for feedback in feedbacks]
+        
+        unique_feedbacks = list(dict.fromkeys(feedbacks))
+        if len(unique_feedbacks) < len(feedbacks):
+            scores = dict(zip(
+                unique_feedbacks,
+                SentimentAnalyzer.analyze_batch(unique_feedbacks, workers)
+            ))
+            return [scores[feedback] for feedback in feedbacks]
+        
+        # A few chunks per worker balances uneven entry lengths, while the
+        # minimum size keeps inter-process overhead small
+        chunk_size = max(64, -(-len(feedbacks) // (workers * 4)))
+        chunks = [feedbacks[i:i + chunk_size] for i in range(0, len(feedbacks), chunk_size)]
+        
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                 initializer=SentimentAnalyzer.warmup) as executor:
+            return [
+                score
+                for chunk_scores in executor.map(SentimentAnalyzer.analyze_batch, chunks)
+                for score in chunk_scores
+            ]
 
 
 class FeedbackCategorizer:
     """Maps sentiment scores to categories (Happy, Sad, Mild)."""
     
     @staticmethod
-    def get_category_thresholds() -> dict:
+    def get_category_thresholds() -> Mapping[str, Tuple[float, float]]:
         """Get the threshold values for each category.
         
+        The same read-only mapping is returned on every call, so callers
+        cannot alter the thresholds and no dict is built per call.
+        
         Returns:
-            Dictionary mapping category names to their (min, max) threshold tuples
+            Read-only mapping of category names to their (min, max) threshold tuples
         """
-        return {
-            'Happy': (0.1, 1.0),
-            'Sad': (-1.0, -0.1),
-            'Mild': (-0.1, 0.1)
-        }
+        return _CATEGORY_THRESHOLDS
     
     @staticmethod
     def categorize(polarity_score: float) -> str:
@@ -299,11 +777,43 @@ class FeedbackCategorizer:
             Category as string ("Happy", "Sad", or "Mild")
         """
         if polarity_score > 0.1:
-            return "Happy"
+            return HAPPY
         elif polarity_score < -0.1:
-            return "Sad"
+            return SAD
         else:
-            return "Mild"
+            return MILD
+    
+    @staticmethod
+    def categorize_batch(polarity_scores: List[float]) -> List[str]:
+        """Map a list of polarity scores to sentiment categories.
+        
+        Uses the same thresholds as categorize(), via categorize_codes().
+        
+        Args:
+            polarity_scores: The sentiment polarity scores to categorize
+            
+        Returns:
+            Categories in the same order as the input scores
+        """
+        return [CATEGORIES[code] for code in FeedbackCategorizer.categorize_codes(polarity_scores)]
+    
+    @staticmethod
+    def categorize_codes(polarity_scores: List[float]) -> bytearray:
+        """Map a list of polarity scores to one-byte category codes.
+        
+        Codes index CATEGORIES (0: Happy, 1: Sad, 2: Mild) and use the same
+        thresholds as categorize().
+        
+        Args:
+            polarity_scores: The sentiment polarity scores to categorize
+            
+        Returns:
+            Category codes in the same order as the input scores
+        """
+        return bytearray([
+            0 if score > 0.1 else 1 if score < -0.1 else 2
+            for score in polarity_scores
+        ])
 
 
 class ResultFormatter:
@@ -324,63 +834,103 @@ class ResultFormatter:
         return f"{feedback} | {category} | {score:.3f}"
     
     @staticmethod
-    def display_results(results: List[FeedbackResult]) -> None:
-        """Display all analysis results in a structured table format.
+    def _table_rows(results: Union[FeedbackResults, List[FeedbackResult]], start: int, stop: int):
+        """Get (feedback, category, score) tuples for a range of results.
+        
+        Args:
+            results: FeedbackResults or list of FeedbackResult objects
+            start: Index of the first result
+            stop: Index after the last result
+            
+        Returns:
+            Iterator of (feedback, category, sentiment_score) tuples
+        """
+        if isinstance(results, FeedbackResults):
+            return zip(
+                results.feedback_texts[start:stop],
+                map(CATEGORIES.__getitem__, results.category_codes[start:stop]),
+                results.sentiment_scores[start:stop]
+            )
+        return ((r.feedback_text, r.category, r.sentiment_score) for r in results[start:stop])
+    
+    @staticmethod
+    def display_results(results: Union[FeedbackResults, List[FeedbackResult]],
+                        max_rows: Optional[int] = None) -> None:
+        """Display analysis results in a structured table format.
+        
+        With max_rows set and more results than that, only the first and last
+        rows are formatted, with a line noting how many were left out.
         
         Args:
-            results: List of FeedbackResult objects to display
+            results: FeedbackResults or list of FeedbackResult objects to display
+            max_rows: Maximum number of result rows to show, 0 or more
+                (default: None, show all)
         """
         if not results:
             print("No results to display.")
             return
         
-        # Print header
-        print("\n" + "=" * 80)
-        print(f"{'Feedback':<50} | {'Category':<10} | {'Score':<10}")
-        print("=" * 80)
+        total = len(results)
+        if max_rows is None or total <= max_rows:
+            head_count, tail_count = total, 0
+        else:
+            tail_count = max_rows // 2
+            head_count = max_rows - tail_count
         
-        # Print each result
-        for result in results:
-            # Truncate long feedback for display
-            feedback_display = result.feedback_text[:47] + "..." if len(result.feedback_text) > 50 else result.feedback_text
-            print(f"{feedback_display:<50} | {result.category:<10} | {result.sentiment_score:<10.3f}")
+        def format_rows(rows):
+            return (
+                _format_table_row(text if len(text) <= 50 else text[:47] + "...", category, score)
+                for text, category, score in rows
+            )
         
-        print("=" * 80 + "\n")
+        # Render the table, truncating long feedback for display, and write
+        # it in one call instead of printing row by row
+        border = "=" * 80
+        lines = ["", border, f"{'Feedback':<50} | {'Category':<10} | {'Score':<10}", border]
+        lines.extend(format_rows(ResultFormatter._table_rows(results, 0, head_count)))
+        if head_count + tail_count < total:
+            lines.append(f"... {total - head_count - tail_count} more results not shown ...")
+            lines.extend(format_rows(ResultFormatter._table_rows(results, total - tail_count, total)))
+        lines.append(border + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     @staticmethod
-    def display_summary(results: List[FeedbackResult]) -> None:
+    def display_summary(results: Union[FeedbackResults, List[FeedbackResult]]) -> None:
         """Display summary statistics with category counts.
         
         Args:
-            results: List of FeedbackResult objects to summarize
+            results: FeedbackResults or list of FeedbackResult objects to summarize
         """
         if not results:
             print("No results to summarize.")
             return
         
-        # Count feedback by category
-        happy_count = sum(1 for r in results if r.category == "Happy")
-        sad_count = sum(1 for r in results if r.category == "Sad")
-        mild_count = sum(1 for r in results if r.category == "Mild")
-        total_count = len(results)
+        # Count feedback by category in a single pass
+        if isinstance(results, FeedbackResults):
+            counts = {category: results.count(category) for category in CATEGORIES}
+        else:
+            counts = Counter(r.category for r in results)
         
         # Create summary object
         summary = AnalysisSummary(
-            total_count=total_count,
-            happy_count=happy_count,
-            sad_count=sad_count,
-            mild_count=mild_count
+            total_count=len(results),
+            happy_count=counts[HAPPY],
+            sad_count=counts[SAD],
+            mild_count=counts[MILD]
         )
         
-        # Display summary
-        print("\n" + "=" * 50)
-        print("ANALYSIS SUMMARY")
-        print("=" * 50)
-        print(f"Total Feedback: {summary.total_count}")
-        print(f"Happy: {summary.happy_count} ({summary.get_percentage('happy'):.1f}%)")
-        print(f"Sad: {summary.sad_count} ({summary.get_percentage('sad'):.1f}%)")
-        print(f"Mild: {summary.mild_count} ({summary.get_percentage('mild'):.1f}%)")
-        print("=" * 50 + "\n")
+        # Render the summary and write it in one call
+        border = "=" * 50
+        sys.stdout.write(
+            f"\n{border}\n"
+            f"ANALYSIS SUMMARY\n"
+            f"{border}\n"
+            f"Total Feedback: {summary.total_count}\n"
+            f"Happy: {summary.happy_count} ({summary.get_percentage('happy'):.1f}%)\n"
+            f"Sad: {summary.sad_count} ({summary.get_percentage('sad'):.1f}%)\n"
+            f"Mild: {summary.mild_count} ({summary.get_percentage('mild'):.1f}%)\n"
+            f"{border}\n\n"
+        )
 
 
 class CSVExporter:
@@ -417,14 +967,73 @@ class CSVExporter:
                 )
     
     @staticmethod
-    def export(results: List[FeedbackResult], output_path: str) -> bool:
+    def export(results: Union[FeedbackResults, List[FeedbackResult]], output_path: str) -> bool:
         """Export analysis results to a CSV file.
         
         The CSV file will contain three columns: feedback, category, and sentiment_score.
         If the output file already exists, it will be overwritten.
         
         Args:
-            results: List of FeedbackResult objects to export
+            results: FeedbackResults or list of FeedbackResult objects to export
+            output_path: Path where the CSV file should be saved
+            
+        Returns:
+            True if export was successful, False otherwise
+            
+        Raises:
+            PermissionError: If the file cannot be written due to permissions
+            OSError: If the file cannot be written for other reasons
+        """
+        if isinstance(results, FeedbackResults):
+            return CSVExporter.export_columns(
+                results.feedback_texts, results.iter_categories(), results.sentiment_scores, output_path
+            )
+        
+        rows = (
+            (result.feedback_text, result.category, result.sentiment_score)
+            for result in results
+        )
+        return CSVExporter._write_rows(rows, output_path)
+    
+    @staticmethod
+    def export_columns(feedback_texts: Iterable[str], categories: Iterable[str],
+                       sentiment_scores: Iterable[float], output_path: str) -> bool:
+        """Export analysis results held as parallel columns to a CSV file.
+        
+        Produces the same file as export(), but zips the columns straight into
+        the row formatter instead of reading attributes from per-row objects.
+        
+        Each column may be any iterable, such as an iterator or array('d'); the
+        columns are read once, in step, and stop at the shortest.
+        
+        Args:
+            feedback_texts: Iterable of original feedback text for each result
+            categories: Iterable of sentiment categories, one per result
+            sentiment_scores: Iterable of sentiment polarity scores, one per result
+            output_path: Path where the CSV file should be saved
+            
+        Returns:
+            True if export was successful, False otherwise
+            
+        Raises:
+            PermissionError: If the file cannot be written due to permissions
+            OSError: If the file cannot be written for other reasons
+        """
+        rows = zip(feedback_texts, categories, sentiment_scores)
+        return CSVExporter._write_rows(rows, output_path)
+    
+    @staticmethod
+    def _write_rows(rows, output_path: str) -> bool:
+        """Write the header and (feedback, category, sentiment_score) rows to a CSV file.
+        
+        The schema is fixed, so rows are formatted directly rather than through
+        csv.writer's per-field dialect handling. Known category labels and float
+        scores are written as-is; feedback text and any other value go through
+        _csv_field. The output is byte-identical to csv.writer's default
+        dialect.
+        
+        Args:
+            rows: Iterable of (feedback, category, sentiment_score) tuples
             output_path: Path where the CSV file should be saved
             
         Returns:
@@ -440,19 +1049,17 @@ class CSVExporter:
             
             # Write results to CSV
             try:
-                with open(output_path, 'w', encoding='utf-8', newline='') as f:
-                    writer = csv.writer(f)
-                    
+                with open(output_path, 'w', encoding='utf-8', newline='',
+                          buffering=_WRITE_BUFFER_SIZE) as f:
                     # Write header
-                    writer.writerow(['feedback', 'category', 'sentiment_score'])
+                    f.write(_CSV_HEADER)
                     
-                    # Write each result
-                    for result in results:
-                        writer.writerow([
-                            result.feedback_text,
-                            result.category,
-                            result.sentiment_score
-                        ])
+                    f.writelines(
+                        f"{_csv_field(text)},"
+                        f"{category if type(category) is str and category in _VALID_CATEGORIES else _csv_field(category)},"
+                        f"{score if type(score) is float else _csv_field(score)}\r\n"
+                        for text, category, score in rows
+                    )
                 
                 # Confirm successful file creation
                 print(f"Results successfully exported to: {output_path}")
@@ -483,14 +1090,45 @@ class CommandLineInterface:
     """Handles command-line arguments and orchestrates the analysis pipeline."""
     
     @staticmethod
-    def parse_arguments():
-        """Parse command-line arguments.
+    def _warn_cache_unusable(cache_path: str, error: Exception) -> None:
+        """Report that the sentiment cache cannot be used and the run continues without it.
+        
+        Args:
+            cache_path: Path given with --cache
+            error: The error raised while opening or using the cache
+        """
+        print(f"\nWarning: Could not use sentiment cache: {cache_path}")
+        print(f"  Error: {str(error)}")
+        print(f"  Remediation: Continuing without the cache; check that the path is a writable cache file.")
+    
+    @staticmethod
+    def _non_negative_int(value: str) -> int:
+        """Parse a command-line value that must be a whole number of zero or more.
         
+        Args:
+            value: The value given on the command line
+            
         Returns:
-            argparse.Namespace object containing parsed arguments
+            The parsed integer
+            
+        Raises:
+            argparse.ArgumentTypeError: If the value is not an integer or is negative
         """
-        import argparse
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer value: {value!r}")
+        if number < 0:
+            raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+        return number
+    
+    @staticmethod
+    def _build_parser() -> argparse.ArgumentParser:
+        """Build the command-line argument parser.
         
+        Returns:
+            argparse.ArgumentParser defining all supported arguments
+        """
         parser = argparse.ArgumentParser(
             description='Customer Feedback Analyzer - Categorize feedback into Happy, Sad, and Mild sentiments',
             formatter_class=argparse.RawDescriptionHelpFormatter
@@ -513,36 +1151,41 @@ class CommandLineInterface:
             help='Column name for CSV input files (default: feedback)'
         )
         
-        return parser.parse_args()
-    
-    @staticmethod
-    def display_usage():
-        """Display usage instructions."""
-        import argparse
-        
-        parser = argparse.ArgumentParser(
-            description='Customer Feedback Analyzer - Categorize feedback into Happy, Sad, and Mild sentiments',
-            formatter_class=argparse.RawDescriptionHelpFormatter
-        )
-        
         parser.add_argument(
-            'input',
-            help='Path to input file (text file with one feedback per line, or CSV file)'
+            '--workers',
+            type=CommandLineInterface._non_negative_int,
+            default=1,
+            help='Number of processes used for sentiment analysis (default: 1; 0 uses one per CPU core)'
         )
         
         parser.add_argument(
-            '-o', '--output',
-            default='output.csv',
-            help='Path to output CSV file (default: output.csv)'
+            '--max-display',
+            type=CommandLineInterface._non_negative_int,
+            metavar='N',
+            help='Show at most N results in the console table, from the start and end (default: show all)'
         )
         
         parser.add_argument(
-            '--csv-column',
-            default='feedback',
-            help='Column name for CSV input files (default: feedback)'
+            '--cache',
+            metavar='PATH',
+            help='SQLite file for caching sentiment scores between runs (default: no cache)'
         )
         
-        parser.print_help()
+        return parser
+    
+    @staticmethod
+    def parse_arguments():
+        """Parse command-line arguments.
+        
+        Returns:
+            argparse.Namespace object containing parsed arguments
+        """
+        return CommandLineInterface._build_parser().parse_args()
+    
+    @staticmethod
+    def display_usage():
+        """Display usage instructions."""
+        CommandLineInterface._build_parser().print_help()
     
     @staticmethod
     def run(args) -> int:
@@ -605,32 +1248,66 @@ class CommandLineInterface:
             print("Analyzing sentiment...")
             
             # Analyze and categorize each feedback
-            results = []
+            analyzed_feedback = feedback_list
             skipped_count = 0
             
-            for idx, feedback in enumerate(feedback_list, 1):
+            # Namespaces not built by parse_arguments() may omit newer options
+            workers = getattr(args, 'workers', 1) or None
+            cache_path = getattr(args, 'cache', None)
+            
+            cache = None
+            if cache_path:
                 try:
-                    # Analyze sentiment
-                    score = SentimentAnalyzer.analyze(feedback)
-                    
-                    # Categorize based on score
-                    category = FeedbackCategorizer.categorize(score)
-                    
-                    # Create result object
-                    result = FeedbackResult(
-                        feedback_text=feedback,
-                        category=category,
-                        sentiment_score=score
+                    cache = SentimentCache(cache_path)
+                except sqlite3.Error as e:
+                    CommandLineInterface._warn_cache_unusable(cache_path, e)
+            
+            try:
+                # Score all entries in one pass, across worker processes if requested
+                try:
+                    batch_scores = SentimentAnalyzer.analyze_batch(
+                        feedback_list, workers=workers, cache=cache
                     )
-                    results.append(result)
-                    
-                except Exception as e:
-                    # Log the error and skip this entry
-                    print(f"\nWarning: Skipping feedback entry {idx} due to analysis error:")
-                    print(f"  Feedback: {feedback[:50]}{'...' if len(feedback) > 50 else ''}")
-                    print(f"  Error: {str(e)}")
-                    skipped_count += 1
-                    continue
+                except (sqlite3.Error, UnicodeError) as e:
+                    # A cache that opened but fails in use (locked, read-only,
+                    # foreign schema, unhashable text) must not disable the
+                    # batch path; score everything again without it
+                    if cache is None:
+                        raise
+                    CommandLineInterface._warn_cache_unusable(cache_path, e)
+                    cache.close()
+                    cache = None
+                    batch_scores = SentimentAnalyzer.analyze_batch(feedback_list, workers=workers)
+                scores = array('d', batch_scores)
+            except Exception:
+                # Fall back to per-entry analysis so a single bad entry is
+                # skipped instead of failing the whole batch
+                analyzed_feedback = []
+                scores = array('d')
+                for idx, feedback in enumerate(feedback_list, 1):
+                    try:
+                        score = SentimentAnalyzer.analyze(feedback)
+                    except Exception as e:
+                        # Log the error and skip this entry
+                        print(f"\nWarning: Skipping feedback entry {idx} due to analysis error:")
+                        print(f"  Feedback: {feedback[:50]}{'...' if len(feedback) > 50 else ''}")
+                        print(f"  Error: {str(e)}")
+                        skipped_count += 1
+                        continue
+                    analyzed_feedback.append(feedback)
+                    scores.append(score)
+            finally:
+                if cache is not None:
+                    cache.close()
+            
+            # Categorize based on scores
+            category_codes = FeedbackCategorizer.categorize_codes(scores)
+            
+            results = FeedbackResults(
+                feedback_texts=analyzed_feedback,
+                category_codes=category_codes,
+                sentiment_scores=scores
+            )
             
             if skipped_count > 0:
                 print(f"\nNote: {skipped_count} feedback entries were skipped due to errors.")
@@ -643,7 +1320,7 @@ class CommandLineInterface:
             print(f"Successfully analyzed {len(results)} feedback entries.")
             
             # Display results
-            ResultFormatter.display_results(results)
+            ResultFormatter.display_results(results, max_rows=getattr(args, 'max_display', None))
             ResultFormatter.display_summary(results)
             
             # Export to CSV
@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for the Customer Feedback Analyzer tests.
+"""
+
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+# Project root, resolved once so every test module can import feedback_analyzer
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Import the module under test once, before collection, so each test module
+# (and each xdist worker's collection) finds it already in sys.modules
+import feedback_analyzer  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_sentiment_lexicon():
+    """Load TextBlob and its lexicon once per test process, before any test runs.
+    
+    Otherwise the first scoring test in each process (each xdist worker) pays
+    the import, which can exceed hypothesis's per-example deadline.
+    """
+    feedback_analyzer.SentimentAnalyzer.warmup()
+
+
+def _write_csv(path, rows, fieldnames=('feedback',)):
+    """Write dict rows to a UTF-8 CSV file with a header line.
+    
+    Args:
+        path: Destination file path
+        rows: Iterable of dicts keyed by fieldnames
+        fieldnames: Column names, in order (default: a single 'feedback' column)
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture(scope="session")
+def write_csv():
+    """Helper that writes dict rows to a CSV file; see _write_csv."""
+    return _write_csv
+
+
+@pytest.fixture(scope="session")
+def sample_text_input(tmp_path_factory):
+    """Text input file with three feedback entries, created once per test session."""
+    path = tmp_path_factory.mktemp("input") / "feedback.txt"
+    path.write_text("Great product!\nTerrible experience\nIt's okay\n", encoding='utf-8')
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_csv_input(tmp_path_factory):
+    """CSV input file with feedback and date columns, created once per test session."""
+    path = tmp_path_factory.mktemp("input") / "feedback.csv"
+    _write_csv(path, [
+        {'feedback': 'Excellent service!', 'date': '2024-01-01'},
+        {'feedback': 'Very disappointed', 'date': '2024-01-02'},
+        {'feedback': 'Average quality', 'date': '2024-01-03'},
+    ], fieldnames=('feedback', 'date'))
+    return path
@@ -2,49 +2,42 @@
 Unit tests for FeedbackCategorizer component.
 """
 
-import sys
-from pathlib import Path
+from collections.abc import Mapping
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from feedback_analyzer import FeedbackCategorizer
+from feedback_analyzer import CATEGORIES, FeedbackCategorizer
 
 
-def test_categorize_happy_positive_score():
-    """Test categorization with score > 0.1 returns 'Happy'."""
-    # Test with various scores above 0.1
-    assert FeedbackCategorizer.categorize(0.2) == "Happy"
-    assert FeedbackCategorizer.categorize(0.5) == "Happy"
-    assert FeedbackCategorizer.categorize(0.9) == "Happy"
-    assert FeedbackCategorizer.categorize(1.0) == "Happy"
+# Scores above 0.1 are Happy, below -0.1 are Sad, and Mild in between,
+# with both boundaries themselves counting as Mild
+CATEGORIZE_CASES = [
+    (0.2, "Happy"),
+    (0.5, "Happy"),
+    (0.9, "Happy"),
+    (1.0, "Happy"),
+    (-0.2, "Sad"),
+    (-0.5, "Sad"),
+    (-0.9, "Sad"),
+    (-1.0, "Sad"),
+    (0.0, "Mild"),
+    (0.05, "Mild"),
+    (-0.05, "Mild"),
+    (0.1, "Mild"),
+    (-0.1, "Mild"),
+    (0.10001, "Happy"),
+    (-0.10001, "Sad"),
+]
 
 
-def test_categorize_sad_negative_score():
-    """Test categorization with score < -0.1 returns 'Sad'."""
-    # Test with various scores below -0.1
-    assert FeedbackCategorizer.categorize(-0.2) == "Sad"
-    assert FeedbackCategorizer.categorize(-0.5) == "Sad"
-    assert FeedbackCategorizer.categorize(-0.9) == "Sad"
-    assert FeedbackCategorizer.categorize(-1.0) == "Sad"
-
-
-def test_categorize_mild_neutral_score():
-    """Test categorization with score in [-0.1, 0.1] returns 'Mild'."""
-    # Test with various scores in the mild range
-    assert FeedbackCategorizer.categorize(0.0) == "Mild"
-    assert FeedbackCategorizer.categorize(0.05) == "Mild"
-    assert FeedbackCategorizer.categorize(-0.05) == "Mild"
-
-
-def test_categorize_boundary_values():
-    """Test boundary values for categorization thresholds."""
-    # Test exact boundary values
-    assert FeedbackCategorizer.categorize(0.1) == "Mild"  # Exactly 0.1 is Mild (not > 0.1)
-    assert FeedbackCategorizer.categorize(-0.1) == "Mild"  # Exactly -0.1 is Mild (not < -0.1)
-    
-    # Test just above/below boundaries
-    assert FeedbackCategorizer.categorize(0.10001) == "Happy"
-    assert FeedbackCategorizer.categorize(-0.10001) == "Sad"
+@pytest.mark.parametrize(
+    "score,expected",
+    CATEGORIZE_CASES,
+    ids=[f"{score}-{expected}" for score, expected in CATEGORIZE_CASES]
+)
+def test_categorize(score, expected):
+    """Test that categorize maps each score to the category for its range."""
+    assert FeedbackCategorizer.categorize(score) == expected
 
 
 def test_get_category_thresholds():
@@ -52,7 +45,7 @@ def test_get_category_thresholds():
     thresholds = FeedbackCategorizer.get_category_thresholds()
     
     # Verify structure
-    assert isinstance(thresholds, dict)
+    assert isinstance(thresholds, Mapping)
     assert 'Happy' in thresholds
     assert 'Sad' in thresholds
     assert 'Mild' in thresholds
@@ -61,3 +54,27 @@ def test_get_category_thresholds():
     assert thresholds['Happy'] == (0.1, 1.0)
     assert thresholds['Sad'] == (-1.0, -0.1)
     assert thresholds['Mild'] == (-0.1, 0.1)
+    
+    # The same read-only mapping is returned every time
+    assert thresholds is FeedbackCategorizer.get_category_thresholds()
+    with pytest.raises(TypeError):
+        thresholds['Happy'] = (0.0, 1.0)
+
+
+def test_categorize_batch_matches_categorize():
+    """Test that categorize_batch applies the same thresholds as categorize."""
+    scores = [1.0, 0.2, 0.10001, 0.1, 0.0, -0.1, -0.10001, -0.5, -1.0]
+    
+    categories = FeedbackCategorizer.categorize_batch(scores)
+    
+    assert categories == [FeedbackCategorizer.categorize(s) for s in scores]
+
+
+def test_categorize_codes_matches_categorize():
+    """Test that categorize_codes indexes CATEGORIES with the categorize thresholds."""
+    scores = [1.0, 0.2, 0.10001, 0.1, 0.0, -0.1, -0.10001, -0.5, -1.0]
+    
+    codes = FeedbackCategorizer.categorize_codes(scores)
+    
+    assert isinstance(codes, bytearray)
+    assert [CATEGORIES[c] for c in codes] == [FeedbackCategorizer.categorize(s) for s in scores]
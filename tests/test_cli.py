@@ -3,82 +3,84 @@ Unit tests for CommandLineInterface.
 """
 
 import sys
-import tempfile
-import io
-import contextlib
-from pathlib import Path
+import sqlite3
 import argparse
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from feedback_analyzer import CommandLineInterface
+from feedback_analyzer import CommandLineInterface, SentimentAnalyzer, SentimentCache
 
 
-def test_parse_arguments_with_input_only():
+def test_parse_arguments_with_input_only(monkeypatch):
     """Test parsing of required input argument."""
-    # Mock sys.argv
-    test_args = ['script.py', 'input.txt']
-    
-    with contextlib.redirect_stdout(io.StringIO()):
-        # Temporarily replace sys.argv
-        original_argv = sys.argv
-        try:
-            sys.argv = test_args
-            args = CommandLineInterface.parse_arguments()
-            
-            assert args.input == 'input.txt'
-            assert args.output == 'output.csv'  # default value
-            assert args.csv_column == 'feedback'  # default value
-        finally:
-            sys.argv = original_argv
-
-
-def test_parse_arguments_with_output():
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.txt'])
+    
+    args = CommandLineInterface.parse_arguments()
+    
+    assert args.input == 'input.txt'
+    assert args.output == 'output.csv'  # default value
+    assert args.csv_column == 'feedback'  # default value
+
+
+def test_parse_arguments_with_output(monkeypatch):
     """Test parsing of optional output argument."""
-    # Mock sys.argv
-    test_args = ['script.py', 'input.txt', '-o', 'custom_output.csv']
-    
-    with contextlib.redirect_stdout(io.StringIO()):
-        # Temporarily replace sys.argv
-        original_argv = sys.argv
-        try:
-            sys.argv = test_args
-            args = CommandLineInterface.parse_arguments()
-            
-            assert args.input == 'input.txt'
-            assert args.output == 'custom_output.csv'
-            assert args.csv_column == 'feedback'  # default value
-        finally:
-            sys.argv = original_argv
-
-
-def test_parse_arguments_with_csv_column():
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.txt', '-o', 'custom_output.csv'])
+    
+    args = CommandLineInterface.parse_arguments()
+    
+    assert args.input == 'input.txt'
+    assert args.output == 'custom_output.csv'
+    assert args.csv_column == 'feedback'  # default value
+
+
+def test_parse_arguments_with_csv_column(monkeypatch):
     """Test parsing of optional csv-column argument."""
-    # Mock sys.argv
-    test_args = ['script.py', 'input.csv', '--csv-column', 'comments']
-    
-    with contextlib.redirect_stdout(io.StringIO()):
-        # Temporarily replace sys.argv
-        original_argv = sys.argv
-        try:
-            sys.argv = test_args
-            args = CommandLineInterface.parse_arguments()
-            
-            assert args.input == 'input.csv'
-            assert args.output == 'output.csv'  # default value
-            assert args.csv_column == 'comments'
-        finally:
-            sys.argv = original_argv
-
-
-def test_display_usage():
-    """Test display of usage when no arguments provided."""
-    output = io.StringIO()
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.csv', '--csv-column', 'comments'])
     
-    with contextlib.redirect_stdout(output):
-        CommandLineInterface.display_usage()
+    args = CommandLineInterface.parse_arguments()
+    
+    assert args.input == 'input.csv'
+    assert args.output == 'output.csv'  # default value
+    assert args.csv_column == 'comments'
+
+
+def test_parse_arguments_with_workers(monkeypatch):
+    """Test parsing of optional workers argument."""
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.txt', '--workers', '4'])
+    assert CommandLineInterface.parse_arguments().workers == 4
+    
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.txt'])
+    assert CommandLineInterface.parse_arguments().workers == 1  # default value
+
+
+@pytest.mark.parametrize("value", ["-3", "two"])
+def test_parse_arguments_rejects_invalid_workers(value, monkeypatch, capsys):
+    """Test that a negative or non-integer worker count is a usage error."""
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.txt', '--workers', value])
+    
+    with pytest.raises(SystemExit) as exc_info:
+        CommandLineInterface.parse_arguments()
+    
+    assert exc_info.value.code == 2
+    assert '--workers' in capsys.readouterr().err
+
+
+def test_parse_arguments_rejects_negative_max_display(monkeypatch, capsys):
+    """Test that a negative console row limit is a usage error."""
+    monkeypatch.setattr(sys, 'argv', ['script.py', 'input.txt', '--max-display', '-1'])
+    
+    with pytest.raises(SystemExit) as exc_info:
+        CommandLineInterface.parse_arguments()
+    
+    assert exc_info.value.code == 2
+    assert '--max-display' in capsys.readouterr().err
+
+
+def test_display_usage(capsys):
+    """Test display of usage when no arguments provided."""
+    CommandLineInterface.display_usage()
     
-    usage_text = output.getvalue()
+    usage_text = capsys.readouterr().out
     
     # Verify usage text contains key information
     assert 'Customer Feedback Analyzer' in usage_text
@@ -86,158 +88,120 @@ def test_display_usage():
     assert 'output' in usage_text
 
 
-def test_exit_code_success():
-    """Test exit code 0 for successful execution."""
-    # Create temporary input file with valid feedback
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        f.write("This is great!\n")
-        f.write("I love this product.\n")
-        input_path = f.name
-    
-    # Create temporary output file path
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as f:
-        output_path = f.name
-    
-    try:
-        # Create args namespace
-        args = argparse.Namespace(
-            input=input_path,
-            output=output_path,
-            csv_column='feedback'
-        )
-        
-        # Run the CLI with suppressed output
-        with contextlib.redirect_stdout(io.StringIO()):
-            exit_code = CommandLineInterface.run(args)
-        
-        # Verify exit code is 0 for success
-        assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
-    
-    finally:
-        # Clean up
-        Path(input_path).unlink(missing_ok=True)
-        Path(output_path).unlink(missing_ok=True)
-
-
-def test_exit_code_file_not_found():
-    """Test exit code 1 for file not found error."""
-    # Create args namespace with non-existent file
+@pytest.fixture
+def cli_input(request, tmp_path, write_csv):
+    """Input file path for a CLI run, selected by the case name in request.param."""
+    case = request.param
+    if case == "valid_txt":
+        return request.getfixturevalue("sample_text_input")
+    if case == "valid_csv":
+        return request.getfixturevalue("sample_csv_input")
+    if case == "missing":
+        return tmp_path / "nonexistent_file_12345.txt"
+    if case == "empty":
+        path = tmp_path / "empty.txt"
+        path.write_text("", encoding='utf-8')
+        return path
+    if case == "bad_csv":
+        # CSV file without the expected column
+        path = tmp_path / "input.csv"
+        write_csv(path, [{'wrong_column': 'some data'}], fieldnames=('wrong_column',))
+        return path
+    raise ValueError(f"Unknown CLI input case: {case}")
+
+
+@pytest.mark.parametrize("cli_input,expected_code,expected_message", [
+    ("valid_txt", 0, "Successfully analyzed"),
+    ("missing", 1, "File not found"),
+    ("bad_csv", 3, "Invalid CSV format"),
+    ("empty", 0, "No valid feedback"),
+    ("valid_csv", 0, "Successfully analyzed"),
+], indirect=["cli_input"])
+def test_run_exit_code(cli_input, expected_code, expected_message, tmp_path, capsys):
+    """Test the exit code and console message of a CLI run for each kind of input."""
+    output_path = tmp_path / "output.csv"
     args = argparse.Namespace(
-        input='nonexistent_file_12345.txt',
-        output='output.csv',
+        input=str(cli_input),
+        output=str(output_path),
         csv_column='feedback'
     )
     
-    # Run the CLI with suppressed output
-    with contextlib.redirect_stdout(io.StringIO()):
-        exit_code = CommandLineInterface.run(args)
-    
-    # Verify exit code is 1 for file not found
-    assert exit_code == 1, f"Expected exit code 1 for file not found, got {exit_code}"
-
-
-def test_exit_code_csv_column_not_found():
-    """Test exit code 3 for invalid CSV format (missing column)."""
-    import csv
-    
-    # Create temporary CSV file without the expected column
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['wrong_column'])
-        writer.writeheader()
-        writer.writerow({'wrong_column': 'some data'})
-        input_path = f.name
-    
-    try:
-        # Create args namespace
-        args = argparse.Namespace(
-            input=input_path,
-            output='output.csv',
-            csv_column='feedback'
-        )
-        
-        # Run the CLI with suppressed output
-        with contextlib.redirect_stdout(io.StringIO()):
-            exit_code = CommandLineInterface.run(args)
-        
-        # Verify exit code is 3 for invalid format
-        assert exit_code == 3, f"Expected exit code 3 for invalid format, got {exit_code}"
-    
-    finally:
-        # Clean up
-        Path(input_path).unlink(missing_ok=True)
-
-
-def test_empty_input_file():
-    """Test handling of empty input file (should return 0 with warning)."""
-    # Create temporary empty input file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        input_path = f.name
-    
-    # Create temporary output file path
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as f:
-        output_path = f.name
-    
-    try:
-        # Create args namespace
-        args = argparse.Namespace(
-            input=input_path,
-            output=output_path,
-            csv_column='feedback'
-        )
-        
-        # Run the CLI and capture output
-        output = io.StringIO()
-        with contextlib.redirect_stdout(output):
-            exit_code = CommandLineInterface.run(args)
-        
-        # Verify exit code is 0 (graceful handling)
-        assert exit_code == 0, f"Expected exit code 0 for empty file, got {exit_code}"
-        
-        # Verify warning message was displayed
-        output_text = output.getvalue()
-        assert 'Warning' in output_text or 'No valid feedback' in output_text
-    
-    finally:
-        # Clean up
-        Path(input_path).unlink(missing_ok=True)
-        Path(output_path).unlink(missing_ok=True)
-
-
-def test_csv_input_processing():
-    """Test processing of CSV input file."""
-    import csv
-    
-    # Create temporary CSV file with feedback
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['feedback'])
-        writer.writeheader()
-        writer.writerow({'feedback': 'This is excellent!'})
-        writer.writerow({'feedback': 'This is terrible!'})
-        input_path = f.name
-    
-    # Create temporary output file path
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as f:
-        output_path = f.name
-    
-    try:
-        # Create args namespace
-        args = argparse.Namespace(
-            input=input_path,
-            output=output_path,
-            csv_column='feedback'
-        )
-        
-        # Run the CLI with suppressed output
-        with contextlib.redirect_stdout(io.StringIO()):
-            exit_code = CommandLineInterface.run(args)
-        
-        # Verify exit code is 0 for success
-        assert exit_code == 0, f"Expected exit code 0, got {exit_code}"
-        
-        # Verify output file was created
-        assert Path(output_path).exists(), "Output file should be created"
-    
-    finally:
-        # Clean up
-        Path(input_path).unlink(missing_ok=True)
-        Path(output_path).unlink(missing_ok=True)
+    exit_code = CommandLineInterface.run(args)
+    
+    assert exit_code == expected_code, f"Expected exit code {expected_code}, got {exit_code}"
+    assert expected_message in capsys.readouterr().out
+    
+    # Successful runs, including empty input, always write the output file
+    assert output_path.exists() == (expected_code == 0)
+
+
+def test_run_continues_without_unusable_cache(sample_text_input, tmp_path, capsys):
+    """Test that a cache file with a foreign schema is reported when opened and the run still succeeds."""
+    cache_path = tmp_path / "bad.db"
+    connection = sqlite3.connect(str(cache_path))
+    connection.execute("CREATE TABLE cache (x TEXT)")
+    connection.commit()
+    connection.close()
+    output_path = tmp_path / "output.csv"
+    args = argparse.Namespace(
+        input=str(sample_text_input),
+        output=str(output_path),
+        csv_column='feedback',
+        workers=1,
+        cache=str(cache_path)
+    )
+    
+    exit_code = CommandLineInterface.run(args)
+    
+    captured = capsys.readouterr().out
+    assert exit_code == 0
+    assert "Could not use sentiment cache" in captured
+    assert "Successfully analyzed" in captured
+    assert "were skipped" not in captured
+
+
+@pytest.mark.parametrize("method", ["get_many", "put_many"])
+def test_run_continues_when_cache_fails_during_analysis(method, sample_text_input, tmp_path, capsys, monkeypatch):
+    """Test that a cache which opens but then fails is reported and scoring stays batched."""
+    def failing_cache_call(self, *args):
+        raise sqlite3.OperationalError("attempt to write a readonly database")
+    
+    def per_entry_fallback(feedback_text):
+        raise AssertionError("cache errors must not trigger the per-entry fallback")
+    
+    monkeypatch.setattr(SentimentCache, method, failing_cache_call)
+    monkeypatch.setattr(SentimentAnalyzer, 'analyze', staticmethod(per_entry_fallback))
+    output_path = tmp_path / "output.csv"
+    args = argparse.Namespace(
+        input=str(sample_text_input),
+        output=str(output_path),
+        csv_column='feedback',
+        workers=1,
+        cache=str(tmp_path / "cache.db")
+    )
+    
+    exit_code = CommandLineInterface.run(args)
+    
+    captured = capsys.readouterr().out
+    assert exit_code == 0
+    assert "Could not use sentiment cache" in captured
+    assert "readonly database" in captured
+    assert "were skipped" not in captured
+    assert len(output_path.read_text(encoding='utf-8').splitlines()) == 4  # header and 3 results
+
+
+def test_run_passes_max_display_to_results_table(sample_text_input, tmp_path, capsys):
+    """Test that --max-display limits the console table of a CLI run."""
+    args = argparse.Namespace(
+        input=str(sample_text_input),
+        output=str(tmp_path / "output.csv"),
+        csv_column='feedback',
+        max_display=2
+    )
+    
+    assert CommandLineInterface.run(args) == 0
+    
+    output = capsys.readouterr().out
+    assert "Great product!" in output
+    assert "It's okay" in output
+    assert "... 1 more results not shown ..." in output
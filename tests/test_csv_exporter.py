@@ -5,23 +5,27 @@ Unit tests for CSVExporter component.
 import csv
 import tempfile
 import io
-import contextlib
+from array import array
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from feedback_analyzer import CSVExporter, FeedbackResult
+from feedback_analyzer import CSVExporter, FeedbackResult, FeedbackResults
 
 
-def test_export_to_new_file():
-    """Test successful export to a new CSV file."""
-    # Create test results
-    results = [
+@pytest.fixture(scope="module")
+def sample_results():
+    """Results shared by the export tests; tests must not mutate the list."""
+    return [
         FeedbackResult("Great product!", "Happy", 0.8),
         FeedbackResult("Not good at all", "Sad", -0.6),
         FeedbackResult("It's okay", "Mild", 0.05)
     ]
+
+
+def test_export_to_new_file(sample_results):
+    """Test successful export to a new CSV file."""
+    results = sample_results
     
     # Create a temporary file path
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
@@ -31,9 +35,8 @@ def test_export_to_new_file():
     Path(temp_path).unlink()
     
     try:
-        # Export results (suppress print output)
-        with contextlib.redirect_stdout(io.StringIO()):
-            success = CSVExporter.export(results, temp_path)
+        # Export results
+        success = CSVExporter.export(results, temp_path)
         
         # Verify export was successful
         assert success, "Export should succeed"
@@ -68,12 +71,9 @@ def test_export_to_new_file():
         Path(temp_path).unlink(missing_ok=True)
 
 
-def test_export_overwrites_existing_file():
+def test_export_overwrites_existing_file(sample_results):
     """Test that export overwrites an existing CSV file."""
-    # Create initial results
-    initial_results = [
-        FeedbackResult("Old feedback", "Happy", 0.5)
-    ]
+    initial_results = sample_results
     
     # Create a temporary file
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
@@ -81,8 +81,7 @@ def test_export_overwrites_existing_file():
     
     try:
         # Export initial results
-        with contextlib.redirect_stdout(io.StringIO()):
-            CSVExporter.export(initial_results, temp_path)
+        CSVExporter.export(initial_results, temp_path)
         
         # Verify initial file exists
         assert Path(temp_path).exists()
@@ -94,20 +93,16 @@ def test_export_overwrites_existing_file():
         ]
         
         # Export new results (should overwrite)
-        with contextlib.redirect_stdout(io.StringIO()):
-            success = CSVExporter.export(new_results, temp_path)
+        success = CSVExporter.export(new_results, temp_path)
         
         assert success, "Export should succeed"
         
-        # Verify file was overwritten
-        with open(temp_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
         # Should only have the new results, not the old ones
-        assert len(rows) == 2, "Should have 2 rows (old data overwritten)"
-        assert rows[0]['feedback'] == "New feedback 1"
-        assert rows[1]['feedback'] == "New feedback 2"
+        assert Path(temp_path).read_bytes() == (
+            b"feedback,category,sentiment_score\r\n"
+            b"New feedback 1,Sad,-0.3\r\n"
+            b"New feedback 2,Mild,0.0\r\n"
+        ), "Old data should be overwritten"
     
     finally:
         # Clean up
@@ -130,8 +125,7 @@ def test_export_creates_output_directories():
         ]
         
         # Export results
-        with contextlib.redirect_stdout(io.StringIO()):
-            success = CSVExporter.export(results, str(output_path))
+        success = CSVExporter.export(results, str(output_path))
         
         assert success, "Export should succeed"
         
@@ -142,21 +136,15 @@ def test_export_creates_output_directories():
         assert output_path.exists(), "CSV file should be created"
         
         # Verify file contents
-        with open(output_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
-        assert len(rows) == 1
-        assert rows[0]['feedback'] == "Test feedback"
+        assert output_path.read_bytes() == (
+            b"feedback,category,sentiment_score\r\n"
+            b"Test feedback,Happy,0.7\r\n"
+        )
 
 
-def test_csv_format_correctness():
+def test_csv_format_correctness(sample_results):
     """Test that the CSV file has correct format with proper headers and columns."""
-    # Create test results
-    results = [
-        FeedbackResult("Feedback 1", "Happy", 0.9),
-        FeedbackResult("Feedback 2", "Sad", -0.4)
-    ]
+    results = sample_results
     
     # Create a temporary file
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
@@ -164,30 +152,15 @@ def test_csv_format_correctness():
     
     try:
         # Export results
-        with contextlib.redirect_stdout(io.StringIO()):
-            CSVExporter.export(results, temp_path)
-        
-        # Read the raw CSV to check format
-        with open(temp_path, 'r', encoding='utf-8', newline='') as f:
-            lines = f.readlines()
-        
-        # Check header line
-        assert lines[0].strip() == "feedback,category,sentiment_score", \
-            "CSV should have correct header"
+        CSVExporter.export(results, temp_path)
         
-        # Check that we have the right number of lines (header + data rows)
-        assert len(lines) == 3, "Should have header + 2 data rows"
-        
-        # Verify using DictReader
-        with open(temp_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            
-            # Check fieldnames
-            assert reader.fieldnames == ['feedback', 'category', 'sentiment_score'], \
-                "CSV should have correct column names"
-            
-            rows = list(reader)
-            assert len(rows) == 2, "Should have 2 data rows"
+        # Read the file once and compare it with the expected header and rows
+        assert Path(temp_path).read_bytes() == (
+            b"feedback,category,sentiment_score\r\n"
+            b"Great product!,Happy,0.8\r\n"
+            b"Not good at all,Sad,-0.6\r\n"
+            b"It's okay,Mild,0.05\r\n"
+        ), "CSV should have the header and one line per result"
     
     finally:
         # Clean up
@@ -205,8 +178,7 @@ def test_export_empty_results():
     
     try:
         # Export empty results
-        with contextlib.redirect_stdout(io.StringIO()):
-            success = CSVExporter.export(results, temp_path)
+        success = CSVExporter.export(results, temp_path)
         
         assert success, "Export should succeed even with empty results"
         
@@ -214,12 +186,98 @@ def test_export_empty_results():
         assert Path(temp_path).exists()
         
         # Verify file has header but no data rows
-        with open(temp_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-        
-        assert len(rows) == 0, "Should have no data rows"
+        assert Path(temp_path).read_bytes() == b"feedback,category,sentiment_score\r\n", \
+            "Should have no data rows"
     
     finally:
         # Clean up
         Path(temp_path).unlink(missing_ok=True)
+
+
+def test_export_columns_matches_export():
+    """Test that exporting parallel columns writes the same file as exporting results."""
+    results = [
+        FeedbackResult("Great product!", "Happy", 0.8),
+        FeedbackResult('Said "meh", then left', "Mild", 0.0),
+        FeedbackResult("Not good at all", "Sad", -0.6)
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rows_path = Path(temp_dir) / "rows.csv"
+        columns_path = Path(temp_dir) / "columns.csv"
+        
+        assert CSVExporter.export(results, str(rows_path))
+        assert CSVExporter.export_columns(
+            [r.feedback_text for r in results],
+            [r.category for r in results],
+            [r.sentiment_score for r in results],
+            str(columns_path)
+        )
+        
+        assert columns_path.read_bytes() == rows_path.read_bytes()
+
+
+def test_export_feedback_results_columns(sample_results):
+    """Test that columnar FeedbackResults export the same file as a list of results."""
+    results = sample_results
+    columns = FeedbackResults(
+        feedback_texts=[r.feedback_text for r in results],
+        category_codes=bytearray([0, 1, 2]),
+        sentiment_scores=array('d', (r.sentiment_score for r in results))
+    )
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rows_path = Path(temp_dir) / "rows.csv"
+        columns_path = Path(temp_dir) / "columns.csv"
+        
+        assert CSVExporter.export(results, str(rows_path))
+        assert CSVExporter.export(columns, str(columns_path))
+        
+        assert columns_path.read_bytes() == rows_path.read_bytes()
+
+
+def test_export_matches_csv_writer():
+    """Test that exported bytes match csv.writer's default dialect for awkward values."""
+    results = [
+        FeedbackResult('He said "great", then left', "Happy", 0.8),
+        FeedbackResult("Line one\nline two", "Sad", -0.6),
+        FeedbackResult("Carriage\rreturn", "Mild", 0.0),
+        FeedbackResult("  padded, with comma  ", "Mild", 1e-05),
+        FeedbackResult("Café ☕ naïve", "Happy", 0.1000000001),
+        FeedbackResult("Plain text", "Odd,label", -1.0)
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / "output.csv"
+        
+        assert CSVExporter.export(results, str(output_path))
+        
+        expected = io.StringIO(newline='')
+        writer = csv.writer(expected)
+        writer.writerow(['feedback', 'category', 'sentiment_score'])
+        writer.writerows((r.feedback_text, r.category, r.sentiment_score) for r in results)
+        
+        assert output_path.read_bytes() == expected.getvalue().encode('utf-8')
+
+
+def test_export_matches_csv_writer_for_non_string_values():
+    """Test that None and non-string values are written as csv.writer would write them."""
+    results = [
+        FeedbackResult(None, "Happy", 0.5),
+        FeedbackResult(42, "Sad", -0.5),
+        FeedbackResult(b"raw, bytes", ["Mild"], None),
+        FeedbackResult("a", "Happy", "1,5"),
+        FeedbackResult("b", "Sad", -1)
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / "output.csv"
+        
+        assert CSVExporter.export(results, str(output_path))
+        
+        expected = io.StringIO(newline='')
+        writer = csv.writer(expected)
+        writer.writerow(['feedback', 'category', 'sentiment_score'])
+        writer.writerows((r.feedback_text, r.category, r.sentiment_score) for r in results)
+        
+        assert output_path.read_bytes() == expected.getvalue().encode('utf-8')
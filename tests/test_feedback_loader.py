@@ -4,59 +4,35 @@ Unit tests for FeedbackLoader component.
 
 import tempfile
 import csv
+import io
 import pytest
 from pathlib import Path
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from feedback_analyzer import FeedbackLoader
 
 
-def test_load_from_valid_text_file():
+def test_load_from_valid_text_file(sample_text_input):
     """Test loading from a valid text file with multiple entries."""
-    # Create a temporary text file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        f.write("Great product!\n")
-        f.write("Terrible experience\n")
-        f.write("It's okay\n")
-        temp_path = f.name
+    # Load feedback
+    feedback = FeedbackLoader.load_from_file(str(sample_text_input))
     
-    try:
-        # Load feedback
-        feedback = FeedbackLoader.load_from_file(temp_path)
-        
-        # Verify results
-        assert len(feedback) == 3
-        assert feedback[0] == "Great product!"
-        assert feedback[1] == "Terrible experience"
-        assert feedback[2] == "It's okay"
-    finally:
-        Path(temp_path).unlink()
+    # Verify results
+    assert len(feedback) == 3
+    assert feedback[0] == "Great product!"
+    assert feedback[1] == "Terrible experience"
+    assert feedback[2] == "It's okay"
 
 
-def test_load_from_valid_csv_file():
+def test_load_from_valid_csv_file(sample_csv_input):
     """Test loading from a valid CSV file with feedback column."""
-    # Create a temporary CSV file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['feedback', 'date'])
-        writer.writeheader()
-        writer.writerow({'feedback': 'Excellent service!', 'date': '2024-01-01'})
-        writer.writerow({'feedback': 'Very disappointed', 'date': '2024-01-02'})
-        writer.writerow({'feedback': 'Average quality', 'date': '2024-01-03'})
-        temp_path = f.name
+    # Load feedback
+    feedback = FeedbackLoader.load_from_csv(str(sample_csv_input))
     
-    try:
-        # Load feedback
-        feedback = FeedbackLoader.load_from_csv(temp_path)
-        
-        # Verify results
-        assert len(feedback) == 3
-        assert feedback[0] == "Excellent service!"
-        assert feedback[1] == "Very disappointed"
-        assert feedback[2] == "Average quality"
-    finally:
-        Path(temp_path).unlink()
+    # Verify results
+    assert len(feedback) == 3
+    assert feedback[0] == "Excellent service!"
+    assert feedback[1] == "Very disappointed"
+    assert feedback[2] == "Average quality"
 
 
 def test_file_not_found_text_file():
@@ -75,63 +51,194 @@ def test_file_not_found_csv_file():
     assert "Input file not found" in str(exc_info.value)
 
 
-def test_filtering_empty_entries_text_file():
-    """Test filtering of empty and whitespace-only entries from text file."""
-    # Create a temporary text file with mixed valid and invalid entries
+def test_file_not_found_path_through_file():
+    """Test that a path nested under a regular file is reported as not found."""
     with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        f.write("Valid feedback\n")
-        f.write("\n")  # Empty line
-        f.write("   \n")  # Whitespace only
-        f.write("Another valid entry\n")
-        f.write("\t\t\n")  # Tabs only
         temp_path = f.name
     
     try:
-        # Load feedback
-        feedback = FeedbackLoader.load_from_file(temp_path)
+        with pytest.raises(FileNotFoundError) as exc_info:
+            FeedbackLoader.load_from_file(str(Path(temp_path) / "feedback.txt"))
         
-        # Verify only valid entries are loaded
-        assert len(feedback) == 2
-        assert feedback[0] == "Valid feedback"
-        assert feedback[1] == "Another valid entry"
+        assert "Input file not found" in str(exc_info.value)
     finally:
         Path(temp_path).unlink()
 
 
+def test_file_not_found_path_with_null_byte():
+    """Test that a path with an embedded null byte is reported as not found."""
+    with pytest.raises(FileNotFoundError) as exc_info:
+        FeedbackLoader.load_from_file("feedback\0.txt")
+    
+    assert "Input file not found" in str(exc_info.value)
+
+
+def test_open_input_keeps_other_value_errors(sample_text_input):
+    """Test that invalid open() arguments are not reported as a missing file."""
+    with pytest.raises(ValueError, match="newline"):
+        FeedbackLoader._open_input(str(sample_text_input), newline='bogus')
+
+
+def test_filtering_empty_entries_text_file():
+    """Test filtering of empty and whitespace-only entries from text file."""
+    # Mixed valid and invalid entries
+    stream = io.StringIO(
+        "Valid feedback\n"
+        "\n"  # Empty line
+        "   \n"  # Whitespace only
+        "Another valid entry\n"
+        "\t\t\n"  # Tabs only
+    )
+    
+    # Load feedback
+    feedback = FeedbackLoader.load_from_file(stream)
+    
+    # Verify only valid entries are loaded
+    assert len(feedback) == 2
+    assert feedback[0] == "Valid feedback"
+    assert feedback[1] == "Another valid entry"
+
+
+@pytest.fixture(scope="module", params=["\n", "\r\n"], ids=["lf", "crlf"])
+def large_text_input(request, tmp_path_factory):
+    """100,000-line text file mixing padded entries with blank lines, plus the expected entries."""
+    lines = []
+    expected = []
+    for i in range(100_000):
+        if i % 10 == 0:
+            lines.append("")
+        elif i % 10 == 5:
+            lines.append(" \t ")
+        else:
+            lines.append(f"  Feedback entry {i}\t")
+            expected.append(f"Feedback entry {i}")
+    path = tmp_path_factory.mktemp("large") / "feedback.txt"
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(request.param.join(lines) + request.param)
+    return path, expected
+
+
+def test_filtering_large_text_file(large_text_input):
+    """Test that filtering scales to a large file and handles either line ending."""
+    path, expected = large_text_input
+    
+    assert FeedbackLoader.load_from_file(str(path)) == expected
+
+
 def test_filtering_empty_entries_csv_file():
     """Test filtering of empty and whitespace-only entries from CSV file."""
-    # Create a temporary CSV file with mixed valid and invalid entries
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['feedback'])
-        writer.writeheader()
-        writer.writerow({'feedback': 'Valid feedback'})
-        writer.writerow({'feedback': ''})  # Empty
-        writer.writerow({'feedback': '   '})  # Whitespace only
-        writer.writerow({'feedback': 'Another valid entry'})
-        writer.writerow({'feedback': '\t\t'})  # Tabs only
+    # Mixed valid and invalid entries
+    stream = io.StringIO(newline='')
+    writer = csv.DictWriter(stream, fieldnames=['feedback'])
+    writer.writeheader()
+    writer.writerow({'feedback': 'Valid feedback'})
+    writer.writerow({'feedback': ''})  # Empty
+    writer.writerow({'feedback': '   '})  # Whitespace only
+    writer.writerow({'feedback': 'Another valid entry'})
+    writer.writerow({'feedback': '\t\t'})  # Tabs only
+    stream.seek(0)
+    
+    # Load feedback
+    feedback = FeedbackLoader.load_from_csv(stream)
+    
+    # Verify only valid entries are loaded
+    assert len(feedback) == 2
+    assert feedback[0] == "Valid feedback"
+    assert feedback[1] == "Another valid entry"
+
+
+@pytest.mark.parametrize("feedback,expected", [
+    # Valid feedback
+    ("This is valid feedback", True),
+    ("x", True),
+    # Invalid feedback
+    ("", False),
+    ("   ", False),
+    ("\t\t", False),
+    ("\n", False),
+    (None, False),
+])
+def test_validate_feedback(feedback, expected):
+    """Test the validate_feedback method."""
+    assert FeedbackLoader.validate_feedback(feedback) is expected
+
+
+def test_validate_feedback_matches_strip():
+    """Test that validate_feedback treats the same characters as whitespace as str.strip."""
+    for text in ["\u00a0", "\u2003\u3000", "\x1c\x1f", " \u00a0x ", "\u200b"]:
+        assert FeedbackLoader.validate_feedback(text) == (text.strip() != "")
+
+
+def test_missing_csv_column():
+    """Test that a missing feedback column raises KeyError listing available columns."""
+    stream = io.StringIO("comment,date\nGreat!,2024-01-01\n")
+    
+    with pytest.raises(KeyError) as exc_info:
+        FeedbackLoader.load_from_csv(stream)
+    
+    assert "Available columns: comment, date" in str(exc_info.value)
+
+
+def test_csv_short_rows_are_skipped():
+    """Test that rows without a value for the feedback column are skipped."""
+    stream = io.StringIO("id,feedback\n1,Great product!\n2\n3,Terrible experience\n")
+    
+    feedback = FeedbackLoader.load_from_csv(stream)
+    
+    assert feedback == ["Great product!", "Terrible experience"]
+
+
+def test_csv_with_utf8_bom():
+    """Test that a UTF-8 byte order mark is not read as part of the first header."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8-sig', newline='') as f:
+        f.write("feedback,date\n")
+        f.write("Great product!,2024-01-01\n")
+        temp_path = f.name
+    
+    try:
+        assert FeedbackLoader.load_from_csv(temp_path) == ["Great product!"]
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_load_utf16_text_file():
+    """Test that text files with a UTF-16 byte order mark are decoded as UTF-16."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-16') as f:
+        f.write("Great product!\nCafé was lovely\n")
         temp_path = f.name
     
     try:
-        # Load feedback
-        feedback = FeedbackLoader.load_from_csv(temp_path)
+        assert FeedbackLoader.load_from_file(temp_path) == ["Great product!", "Café was lovely"]
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_load_latin1_text_file(capsys):
+    """Test that non-UTF-8 text files are read as latin-1 with a warning."""
+    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='latin-1') as f:
+        f.write("Café was lovely\nNaïve design\n")
+        temp_path = f.name
+    
+    try:
+        feedback = FeedbackLoader.load_from_file(temp_path)
         
-        # Verify only valid entries are loaded
-        assert len(feedback) == 2
-        assert feedback[0] == "Valid feedback"
-        assert feedback[1] == "Another valid entry"
+        assert feedback == ["Café was lovely", "Naïve design"]
+        assert "latin-1" in capsys.readouterr().out
     finally:
         Path(temp_path).unlink()
 
 
-def test_validate_feedback():
-    """Test the validate_feedback method."""
-    # Valid feedback
-    assert FeedbackLoader.validate_feedback("This is valid feedback") == True
-    assert FeedbackLoader.validate_feedback("x") == True
+@pytest.mark.parametrize("loader,suffix", [
+    (FeedbackLoader.load_from_file, ".txt"),
+    (FeedbackLoader.load_from_csv, ".csv"),
+])
+def test_invalid_utf16_file_is_not_read_as_latin1(loader, suffix, tmp_path, capsys):
+    """Test that a file that fails to decode as its byte order mark says is reported, not misread."""
+    path = tmp_path / f"input{suffix}"
+    # An unpaired high surrogate after valid UTF-16 text
+    path.write_bytes("feedback\nGreat product!\n".encode('utf-16') + b"\x00\xd8A\x00")
     
-    # Invalid feedback
-    assert FeedbackLoader.validate_feedback("") == False
-    assert FeedbackLoader.validate_feedback("   ") == False
-    assert FeedbackLoader.validate_feedback("\t\t") == False
-    assert FeedbackLoader.validate_feedback("\n") == False
-    assert FeedbackLoader.validate_feedback(None) == False
+    with pytest.raises(UnicodeDecodeError, match="utf-16"):
+        loader(str(path))
+    
+    assert "latin-1" not in capsys.readouterr().out
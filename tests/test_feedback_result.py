@@ -0,0 +1,100 @@
+"""
+Unit tests for the analysis result data models.
+"""
+
+import pytest
+from array import array
+from enum import Enum
+
+from feedback_analyzer import HAPPY, AnalysisSummary, FeedbackResult, FeedbackResults
+
+
+def test_checked_accepts_valid_values():
+    """Test that checked() builds a result from valid values."""
+    result = FeedbackResult.checked("Great product!", "Happy", 0.8)
+    
+    assert result == FeedbackResult("Great product!", "Happy", 0.8)
+
+
+def test_checked_interns_category():
+    """Test that checked() returns the module-level category singleton."""
+    category = "".join(["Ha", "ppy"])
+    
+    assert FeedbackResult.checked("Great product!", category, 0.8).category is HAPPY
+
+
+def test_checked_rejects_invalid_category():
+    """Test that checked() rejects categories outside Happy/Sad/Mild."""
+    with pytest.raises(ValueError) as exc_info:
+        FeedbackResult.checked("Great product!", "Excited", 0.8)
+    
+    assert "Category must be" in str(exc_info.value)
+
+
+class _Category(str, Enum):
+    HAPPY = "Happy"
+    SAD = "Sad"
+
+
+def test_checked_accepts_str_subclass_category():
+    """Test that checked() maps a str subclass equal to a category to its constant."""
+    assert FeedbackResult.checked("Great product!", _Category.HAPPY, 0.8).category is HAPPY
+    assert type(FeedbackResult.checked("Awful", _Category.SAD, -0.8).category) is str
+
+
+@pytest.mark.parametrize("category", [["Happy"], None])
+def test_checked_rejects_non_str_category(category):
+    """Test that checked() raises ValueError, not TypeError, for categories that are not strings."""
+    with pytest.raises(ValueError, match="Category must be"):
+        FeedbackResult.checked("Great product!", category, 0.8)
+
+
+def test_checked_rejects_out_of_range_score():
+    """Test that checked() rejects scores outside [-1.0, 1.0]."""
+    with pytest.raises(ValueError) as exc_info:
+        FeedbackResult.checked("Great product!", "Happy", 1.5)
+    
+    assert "Sentiment score must be between" in str(exc_info.value)
+
+
+def test_result_has_no_instance_dict():
+    """Test that results use slots instead of a per-instance __dict__."""
+    result = FeedbackResult("Great product!", "Happy", 0.8)
+    
+    assert not hasattr(result, '__dict__')
+
+
+def test_feedback_results_rows():
+    """Test that columnar FeedbackResults index and iterate as FeedbackResult rows."""
+    results = FeedbackResults(
+        feedback_texts=["Great product!", "Not good at all"],
+        category_codes=bytearray([0, 1]),
+        sentiment_scores=array('d', [0.8, -0.6])
+    )
+    
+    assert len(results) == 2
+    assert results[1] == FeedbackResult("Not good at all", "Sad", -0.6)
+    assert list(results) == [
+        FeedbackResult("Great product!", "Happy", 0.8),
+        FeedbackResult("Not good at all", "Sad", -0.6)
+    ]
+    assert results.categories == ["Happy", "Sad"]
+    assert results.count("Happy") == 1
+    assert results.count("Mild") == 0
+
+
+def test_summary_get_percentage():
+    """Test that get_percentage accepts category names in any case."""
+    summary = AnalysisSummary(total_count=4, happy_count=2, sad_count=1, mild_count=1)
+    
+    assert summary.get_percentage("Happy") == 50.0
+    assert summary.get_percentage("sad") == 25.0
+    assert summary.get_percentage("MILD") == 25.0
+    assert AnalysisSummary(0, 0, 0, 0).get_percentage("happy") == 0.0
+
+
+def test_summary_has_no_instance_dict():
+    """Test that summaries use slots instead of a per-instance __dict__."""
+    summary = AnalysisSummary(total_count=1, happy_count=1, sad_count=0, mild_count=0)
+    
+    assert not hasattr(summary, '__dict__')
@@ -4,15 +4,12 @@ Property-based tests for Customer Feedback Analyzer.
 These tests verify universal properties that should hold across all valid inputs.
 """
 
-import tempfile
 import csv
 import io
-import contextlib
+from collections import Counter
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+from hypothesis import given, strategies as st, settings, HealthCheck
 
 from feedback_analyzer import (
     FeedbackLoader, 
@@ -24,74 +21,51 @@ from feedback_analyzer import (
 )
 
 
-# Property 3: Input completeness
-# Feature: customer-feedback-analyzer, Property 3: Input completeness
-# Validates: Requirements 1.2, 1.3, 3.2
-@given(st.lists(
-    st.text(
-        min_size=1, 
-        alphabet=st.characters(blacklist_characters='\r\n', blacklist_categories=('Cs',))
-    ).filter(lambda s: s.strip() != ""), 
-    min_size=0, 
-    max_size=50
-))
-@settings(max_examples=100)
-def test_property_input_completeness_text_file(valid_feedback_list):
-    """
-    For any list of valid (non-empty, non-whitespace) feedback entries from a text file,
-    the number of analysis results produced must equal the number of valid input entries.
-    """
-    # Create a temporary text file with the feedback
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        for feedback in valid_feedback_list:
-            f.write(feedback + '\n')
-        temp_path = f.name
-    
-    try:
-        # Load feedback from file
-        loaded_feedback = FeedbackLoader.load_from_file(temp_path)
+# Strategies shared by several properties, built once at import
+LINE_CHARS = st.characters(blacklist_characters='\r\n', blacklist_categories=('Cs',))
+FEEDBACK_LINE = st.text(min_size=1, alphabet=LINE_CHARS).filter(lambda s: s.strip() != "")
+SHORT_FEEDBACK_LINE = st.text(min_size=1, max_size=200, alphabet=LINE_CHARS).filter(lambda s: s.strip() != "")
+CATEGORY = st.sampled_from(["Happy", "Sad", "Mild"])
+SCORE = st.floats(min_value=-1.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+
+
+def load_in_memory(fmt, entries):
+    """Load feedback entries through FeedbackLoader from an in-memory input.
+    
+    Args:
+        fmt: 'txt' for one entry per line, or 'csv' for a 'feedback' column
+        entries: Feedback strings to write, in order
         
-        # Verify the count matches
-        assert len(loaded_feedback) == len(valid_feedback_list), \
-            f"Expected {len(valid_feedback_list)} entries, got {len(loaded_feedback)}"
-    finally:
-        # Clean up
-        Path(temp_path).unlink()
+    Returns:
+        The list returned by the loader for that format
+    """
+    if fmt == 'txt':
+        return FeedbackLoader.load_from_file(io.StringIO(''.join(entry + '\n' for entry in entries)))
+    
+    stream = io.StringIO(newline='')
+    writer = csv.writer(stream)
+    writer.writerow(('feedback',))
+    writer.writerows((entry,) for entry in entries)
+    stream.seek(0)
+    return FeedbackLoader.load_from_csv(stream)
 
 
-@given(st.lists(
-    st.text(
-        min_size=1, 
-        alphabet=st.characters(blacklist_characters='\r\n', blacklist_categories=('Cs',))
-    ).filter(lambda s: s.strip() != ""), 
-    min_size=0, 
-    max_size=50
-))
+# Property 3: Input completeness
+# Feature: customer-feedback-analyzer, Property 3: Input completeness
+# Validates: Requirements 1.2, 1.3, 3.2
+@pytest.mark.parametrize("fmt", ["txt", "csv"])
+@given(st.lists(FEEDBACK_LINE, min_size=0, max_size=50))
 @settings(max_examples=100)
-def test_property_input_completeness_csv_file(valid_feedback_list):
+def test_property_input_completeness(fmt, valid_feedback_list):
     """
-    For any list of valid (non-empty, non-whitespace) feedback entries from a CSV file,
+    For any list of valid (non-empty, non-whitespace) feedback entries from a text or CSV file,
     the number of analysis results produced must equal the number of valid input entries.
     """
-    # Create a temporary CSV file with the feedback
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['feedback'])
-        writer.writeheader()
-        for feedback in valid_feedback_list:
-            writer.writerow({'feedback': feedback})
-        temp_path = f.name
-    
-    try:
-        # Load feedback from CSV
-        loaded_feedback = FeedbackLoader.load_from_csv(temp_path)
-        
-        # Verify the count matches
-        assert len(loaded_feedback) == len(valid_feedback_list), \
-            f"Expected {len(valid_feedback_list)} entries, got {len(loaded_feedback)}"
-    finally:
-        # Clean up
-        Path(temp_path).unlink()
-
+    loaded_feedback = load_in_memory(fmt, valid_feedback_list)
+    
+    # Verify the count matches
+    assert len(loaded_feedback) == len(valid_feedback_list), \
+        f"Expected {len(valid_feedback_list)} entries, got {len(loaded_feedback)}"
 
 
 # Property 4: Whitespace filtering
@@ -104,22 +78,11 @@ def test_property_whitespace_filtering_text_file(whitespace_strings):
     For any feedback string composed entirely of whitespace characters (spaces, tabs, newlines),
     the system must filter it out and not include it in the analysis results.
     """
-    # Create a temporary text file with whitespace-only entries
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        for ws in whitespace_strings:
-            f.write(ws + '\n')
-        temp_path = f.name
-    
-    try:
-        # Load feedback from file
-        loaded_feedback = FeedbackLoader.load_from_file(temp_path)
-        
-        # Verify all whitespace entries are filtered out
-        assert len(loaded_feedback) == 0, \
-            f"Expected 0 entries (all whitespace), got {len(loaded_feedback)}: {loaded_feedback}"
-    finally:
-        # Clean up
-        Path(temp_path).unlink()
+    loaded_feedback = load_in_memory('txt', whitespace_strings)
+    
+    # Verify all whitespace entries are filtered out
+    assert len(loaded_feedback) == 0, \
+        f"Expected 0 entries (all whitespace), got {len(loaded_feedback)}: {loaded_feedback}"
 
 
 @given(st.lists(st.text(alphabet=st.sampled_from(' \t'), min_size=1), min_size=1, max_size=20))
@@ -129,25 +92,11 @@ def test_property_whitespace_filtering_csv_file(whitespace_strings):
     For any feedback string composed entirely of whitespace characters in CSV,
     the system must filter it out and not include it in the analysis results.
     """
-    # Create a temporary CSV file with whitespace-only entries
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['feedback'])
-        writer.writeheader()
-        for ws in whitespace_strings:
-            writer.writerow({'feedback': ws})
-        temp_path = f.name
-    
-    try:
-        # Load feedback from CSV
-        loaded_feedback = FeedbackLoader.load_from_csv(temp_path)
-        
-        # Verify all whitespace entries are filtered out
-        assert len(loaded_feedback) == 0, \
-            f"Expected 0 entries (all whitespace), got {len(loaded_feedback)}: {loaded_feedback}"
-    finally:
-        # Clean up
-        Path(temp_path).unlink()
-
+    loaded_feedback = load_in_memory('csv', whitespace_strings)
+    
+    # Verify all whitespace entries are filtered out
+    assert len(loaded_feedback) == 0, \
+        f"Expected 0 entries (all whitespace), got {len(loaded_feedback)}: {loaded_feedback}"
 
 
 # Property 2: Sentiment score bounds
@@ -171,7 +120,6 @@ def test_property_sentiment_score_bounds(feedback_text):
         f"Score must be in range [-1.0, 1.0], got {score}"
 
 
-
 # Property 8: Positive indicator influence
 # Feature: customer-feedback-analyzer, Property 8: Positive indicator influence
 # Validates: Requirements 6.2
@@ -179,7 +127,7 @@ def test_property_sentiment_score_bounds(feedback_text):
     st.sampled_from(['excellent', 'great', 'love', 'amazing', 'perfect']),
     st.text(min_size=0, max_size=100)
 )
-@settings(max_examples=100)
+@settings(max_examples=25)
 def test_property_positive_indicator_influence(positive_word, additional_text):
     """
     For any feedback text containing common positive indicators (excellent, great, love,
@@ -196,7 +144,6 @@ def test_property_positive_indicator_influence(positive_word, additional_text):
         f"Feedback with positive indicator '{positive_word}' should have positive score, got {score}"
 
 
-
 # Property 9: Negative indicator influence
 # Feature: customer-feedback-analyzer, Property 9: Negative indicator influence
 # Validates: Requirements 6.3
@@ -204,7 +151,7 @@ def test_property_positive_indicator_influence(positive_word, additional_text):
     st.sampled_from(['terrible', 'awful', 'hate', 'worst', 'broken']),
     st.text(min_size=0, max_size=100)
 )
-@settings(max_examples=100)
+@settings(max_examples=25)
 def test_property_negative_indicator_influence(negative_word, additional_text):
     """
     For any feedback text containing common negative indicators (terrible, awful, hate,
@@ -221,15 +168,11 @@ def test_property_negative_indicator_influence(negative_word, additional_text):
         f"Feedback with negative indicator '{negative_word}' should have negative score, got {score}"
 
 
-
 # Property 10: Negation handling
 # Feature: customer-feedback-analyzer, Property 10: Negation handling
 # Validates: Requirements 6.4
-@given(
-    st.sampled_from(['not', 'no', 'never']),
-    st.sampled_from(['good', 'great', 'excellent', 'bad', 'terrible', 'awful'])
-)
-@settings(max_examples=100)
+@pytest.mark.parametrize("negation", ['not', 'no', 'never'])
+@pytest.mark.parametrize("sentiment_word", ['good', 'great', 'excellent', 'bad', 'terrible', 'awful'])
 def test_property_negation_handling(negation, sentiment_word):
     """
     For any feedback text, adding a negation (not, no, never) before a sentiment word
@@ -250,12 +193,11 @@ def test_property_negation_handling(negation, sentiment_word):
         f"Negation should change polarity: '{feedback_without_negation}' ({score_without}) vs '{feedback_with_negation}' ({score_with})"
 
 
-
 # Property 1: Single category assignment
 # Feature: customer-feedback-analyzer, Property 1: Single category assignment
 # Validates: Requirements 2.1, 2.2, 2.3, 2.4
-@given(st.floats(min_value=-1.0, max_value=1.0, allow_nan=False, allow_infinity=False))
-@settings(max_examples=100)
+@given(SCORE)
+@settings(max_examples=25)
 def test_property_single_category_assignment(polarity_score):
     """
     For any feedback text, the sentiment analysis must assign exactly one category from
@@ -280,14 +222,13 @@ def test_property_single_category_assignment(polarity_score):
             f"Score {polarity_score} in [-0.1, 0.1] should be 'Mild', got '{category}'"
 
 
-
 # Property 5: Feedback text preservation
 # Feature: customer-feedback-analyzer, Property 5: Feedback text preservation
 # Validates: Requirements 3.1
 @given(
     st.text(min_size=1, max_size=500),
-    st.sampled_from(["Happy", "Sad", "Mild"]),
-    st.floats(min_value=-1.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+    CATEGORY,
+    SCORE
 )
 @settings(max_examples=100)
 def test_property_feedback_text_preservation(feedback_text, category, score):
@@ -314,15 +255,14 @@ def test_property_feedback_text_preservation(feedback_text, category, score):
         f"Feedback text was modified: expected '{feedback_text}', got '{result.feedback_text}'"
 
 
-
 # Property 6: Summary count consistency
 # Feature: customer-feedback-analyzer, Property 6: Summary count consistency
 # Validates: Requirements 3.4
 @given(st.lists(
     st.tuples(
         st.text(min_size=1, max_size=200),
-        st.sampled_from(["Happy", "Sad", "Mild"]),
-        st.floats(min_value=-1.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+        CATEGORY,
+        SCORE
     ),
     min_size=0,
     max_size=100
@@ -334,32 +274,25 @@ def test_property_summary_count_consistency(result_data):
     must equal the total_count, and each individual category count must match the number
     of results with that category.
     """
-    # Create FeedbackResult objects from the generated data
-    results = [
-        FeedbackResult(feedback_text=text, category=cat, sentiment_score=score)
-        for text, cat, score in result_data
-    ]
+    # Only the category of each generated result affects the counts
+    categories = [cat for _, cat, _ in result_data]
     
-    # Count expected values
-    expected_total = len(results)
-    expected_happy = sum(1 for r in results if r.category == "Happy")
-    expected_sad = sum(1 for r in results if r.category == "Sad")
-    expected_mild = sum(1 for r in results if r.category == "Mild")
+    # Count expected values in a single pass
+    counts = Counter(categories)
+    expected_total = len(categories)
+    expected_happy = counts["Happy"]
+    expected_sad = counts["Sad"]
+    expected_mild = counts["Mild"]
     
     # Use ResultFormatter to generate summary (it creates AnalysisSummary internally)
     # We'll manually create the summary to test it
     from feedback_analyzer import AnalysisSummary
     
-    happy_count = sum(1 for r in results if r.category == "Happy")
-    sad_count = sum(1 for r in results if r.category == "Sad")
-    mild_count = sum(1 for r in results if r.category == "Mild")
-    total_count = len(results)
-    
     summary = AnalysisSummary(
-        total_count=total_count,
-        happy_count=happy_count,
-        sad_count=sad_count,
-        mild_count=mild_count
+        total_count=expected_total,
+        happy_count=expected_happy,
+        sad_count=expected_sad,
+        mild_count=expected_mild
     )
     
     # Verify total count consistency
@@ -379,25 +312,20 @@ def test_property_summary_count_consistency(result_data):
         f"Mild count mismatch: expected {expected_mild}, got {summary.mild_count}"
 
 
-
 # Property 7: CSV round-trip integrity
 # Feature: customer-feedback-analyzer, Property 7: CSV round-trip integrity
 # Validates: Requirements 4.1
 @given(st.lists(
     st.tuples(
-        st.text(
-            min_size=1, 
-            max_size=200,
-            alphabet=st.characters(blacklist_characters='\r\n', blacklist_categories=('Cs',))
-        ).filter(lambda s: s.strip() != ""),
-        st.sampled_from(["Happy", "Sad", "Mild"]),
-        st.floats(min_value=-1.0, max_value=1.0, allow_nan=False, allow_infinity=False)
+        SHORT_FEEDBACK_LINE,
+        CATEGORY,
+        SCORE
     ),
     min_size=0,
     max_size=50
 ))
-@settings(max_examples=100, deadline=None)
-def test_property_csv_round_trip_integrity(result_data):
+@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_property_csv_round_trip_integrity(tmp_path, result_data):
     """
     For any set of analysis results, writing them to CSV and reading them back must
     preserve the feedback text, category, and sentiment score for each entry.
@@ -408,62 +336,43 @@ def test_property_csv_round_trip_integrity(result_data):
         for text, cat, score in result_data
     ]
     
-    # Create a temporary CSV file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv', encoding='utf-8') as f:
-        temp_path = f.name
+    # One CSV path per test; every example overwrites it
+    temp_path = tmp_path / "results.csv"
     
-    try:
-        # Export results to CSV (suppress print output)
-        with contextlib.redirect_stdout(io.StringIO()):
-            success = CSVExporter.export(original_results, temp_path)
-        assert success, "CSV export should succeed"
-        
-        # Read the CSV back
-        read_results = []
-        with open(temp_path, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                read_results.append({
-                    'feedback': row['feedback'],
-                    'category': row['category'],
-                    'sentiment_score': float(row['sentiment_score'])
-                })
-        
-        # Verify the count matches
-        assert len(read_results) == len(original_results), \
-            f"Count mismatch: expected {len(original_results)}, got {len(read_results)}"
+    # Export results to CSV; pytest captures its console output
+    success = CSVExporter.export(original_results, str(temp_path))
+    assert success, "CSV export should succeed"
+    
+    # Read the CSV back, comparing each row with its original as it is parsed
+    with open(temp_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        assert next(reader) == ['feedback', 'category', 'sentiment_score']
         
-        # Verify each entry is preserved
-        for i, (original, read) in enumerate(zip(original_results, read_results)):
-            assert original.feedback_text == read['feedback'], \
-                f"Entry {i}: feedback text mismatch - expected '{original.feedback_text}', got '{read['feedback']}'"
+        read_count = 0
+        for i, (original, (feedback, category, score)) in enumerate(zip(original_results, reader)):
+            read_count += 1
             
-            assert original.category == read['category'], \
-                f"Entry {i}: category mismatch - expected '{original.category}', got '{read['category']}'"
+            assert original.feedback_text == feedback, \
+                f"Entry {i}: feedback text mismatch - expected '{original.feedback_text}', got '{feedback}'"
+            
+            assert original.category == category, \
+                f"Entry {i}: category mismatch - expected '{original.category}', got '{category}'"
             
             # Allow small floating point differences
-            assert abs(original.sentiment_score - read['sentiment_score']) < 1e-6, \
-                f"Entry {i}: sentiment score mismatch - expected {original.sentiment_score}, got {read['sentiment_score']}"
-    
-    finally:
-        # Clean up
-        Path(temp_path).unlink(missing_ok=True)
+            assert abs(original.sentiment_score - float(score)) < 1e-6, \
+                f"Entry {i}: sentiment score mismatch - expected {original.sentiment_score}, got {score}"
+        
+        # Verify the count matches: no rows missing and none left over
+        assert read_count == len(original_results) and next(reader, None) is None, \
+            f"Count mismatch: expected {len(original_results)} rows, matched {read_count}"
 
 
 # Property 11: Successful execution exit code
 # Feature: customer-feedback-analyzer, Property 11: Successful execution exit code
 # Validates: Requirements 5.4
-@given(st.lists(
-    st.text(
-        min_size=1, 
-        max_size=200,
-        alphabet=st.characters(blacklist_characters='\r\n', blacklist_categories=('Cs',))
-    ).filter(lambda s: s.strip() != ""), 
-    min_size=1, 
-    max_size=20
-))
-@settings(max_examples=100, deadline=None)
-def test_property_successful_execution_exit_code(valid_feedback_list):
+@given(st.lists(SHORT_FEEDBACK_LINE, min_size=1, max_size=20))
+@settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_property_successful_execution_exit_code(tmp_path, valid_feedback_list):
     """
     For any successful analysis run (no errors encountered), the script must exit
     with status code 0.
@@ -471,44 +380,32 @@ def test_property_successful_execution_exit_code(valid_feedback_list):
     from feedback_analyzer import CommandLineInterface
     import argparse
     
-    # Create temporary input file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt', encoding='utf-8') as f:
-        for feedback in valid_feedback_list:
-            f.write(feedback + '\n')
-        input_path = f.name
-    
-    # Create temporary output file path
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as f:
-        output_path = f.name
-    
-    try:
-        # Create args namespace
-        args = argparse.Namespace(
-            input=input_path,
-            output=output_path,
-            csv_column='feedback'
-        )
-        
-        # Run the CLI with suppressed output
-        with contextlib.redirect_stdout(io.StringIO()):
-            exit_code = CommandLineInterface.run(args)
-        
-        # Verify exit code is 0 for success
-        assert exit_code == 0, \
-            f"Successful execution should return exit code 0, got {exit_code}"
+    # One input and one output path per test; every example overwrites them
+    input_path = tmp_path / "in.txt"
+    output_path = tmp_path / "out.csv"
+    input_path.write_text(''.join(feedback + '\n' for feedback in valid_feedback_list), encoding='utf-8')
+    
+    # Create args namespace
+    args = argparse.Namespace(
+        input=str(input_path),
+        output=str(output_path),
+        csv_column='feedback'
+    )
     
-    finally:
-        # Clean up
-        Path(input_path).unlink(missing_ok=True)
-        Path(output_path).unlink(missing_ok=True)
+    # Run the CLI; pytest captures its console output
+    exit_code = CommandLineInterface.run(args)
+    
+    # Verify exit code is 0 for success
+    assert exit_code == 0, \
+        f"Successful execution should return exit code 0, got {exit_code}"
 
 
 # Property 12: Error execution exit code
 # Feature: customer-feedback-analyzer, Property 12: Error execution exit code
 # Validates: Requirements 5.5
 @given(st.text(min_size=1, max_size=100).filter(lambda s: not Path(s).exists()))
-@settings(max_examples=100)
-def test_property_error_execution_exit_code(nonexistent_file):
+@settings(max_examples=100, suppress_health_check=[HealthCheck.function_scoped_fixture])
+def test_property_error_execution_exit_code(capsys, tmp_path, nonexistent_file):
     """
     For any execution that encounters an error (file not found, invalid input, etc.),
     the script must exit with a non-zero status code and display an error message.
@@ -519,20 +416,18 @@ def test_property_error_execution_exit_code(nonexistent_file):
     # Create args namespace with non-existent file
     args = argparse.Namespace(
         input=nonexistent_file,
-        output='output.csv',
+        output=str(tmp_path / "output.csv"),
         csv_column='feedback'
     )
     
-    # Run the CLI with suppressed output
-    output = io.StringIO()
-    with contextlib.redirect_stdout(output):
-        exit_code = CommandLineInterface.run(args)
+    # Run the CLI; readouterr() also clears the capture for the next example
+    exit_code = CommandLineInterface.run(args)
+    output_text = capsys.readouterr().out
     
     # Verify exit code is non-zero for error
     assert exit_code != 0, \
         f"Error execution should return non-zero exit code, got {exit_code}"
     
     # Verify an error message was displayed (captured in output)
-    output_text = output.getvalue()
     assert len(output_text) > 0 or exit_code == 1, \
         f"Error execution should display an error message or return error code"
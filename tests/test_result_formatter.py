@@ -0,0 +1,33 @@
+"""
+Unit tests for ResultFormatter component.
+"""
+
+from feedback_analyzer import FeedbackResult, FeedbackResults, ResultFormatter
+
+
+def test_display_results_shows_all_rows_by_default(capsys):
+    """Test that every result is listed when no row limit is given."""
+    results = [FeedbackResult(f"Feedback {i}", "Mild", 0.0) for i in range(5)]
+    ResultFormatter.display_results(results)
+    output = capsys.readouterr().out
+    
+    for i in range(5):
+        assert f"Feedback {i} " in output
+    assert "not shown" not in output
+
+
+def test_display_results_with_max_rows(capsys):
+    """Test that a row limit keeps the first and last results and notes the rest."""
+    columns = FeedbackResults(
+        feedback_texts=[f"Feedback {i}" for i in range(10)],
+        category_codes=bytearray([2] * 10),
+        sentiment_scores=[0.0] * 10
+    )
+    
+    for results in (columns, list(columns)):
+        ResultFormatter.display_results(results, max_rows=3)
+        output = capsys.readouterr().out
+        
+        shown = [i for i in range(10) if f"Feedback {i} " in output]
+        assert shown == [0, 1, 9]
+        assert "... 7 more results not shown ..." in output
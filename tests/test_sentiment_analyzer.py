@@ -2,48 +2,36 @@
 Unit tests for SentimentAnalyzer component.
 """
 
+import sqlite3
+import subprocess
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from feedback_analyzer import SentimentAnalyzer
+from feedback_analyzer import SentimentAnalyzer, SentimentCache
 
 
-def test_clearly_positive_feedback():
-    """Test that clearly positive feedback receives a positive sentiment score."""
-    feedback = "This is excellent! I love it!"
+@pytest.mark.parametrize("feedback,expected", [
+    ("This is excellent! I love it!", "positive"),
+    ("This is terrible! I hate it!", "negative"),
+    ("This is a product.", "neutral"),
+    ("Great!", "positive"),  # Very short feedback (< 3 words) is still analyzed
+])
+def test_sentiment_direction(feedback, expected):
+    """Test that feedback receives a valid score with the expected sentiment direction."""
     score = SentimentAnalyzer.analyze(feedback)
     
-    assert score > 0, f"Expected positive score for positive feedback, got {score}"
-
-
-def test_clearly_negative_feedback():
-    """Test that clearly negative feedback receives a negative sentiment score."""
-    feedback = "This is terrible! I hate it!"
-    score = SentimentAnalyzer.analyze(feedback)
-    
-    assert score < 0, f"Expected negative score for negative feedback, got {score}"
-
-
-def test_neutral_feedback():
-    """Test that neutral feedback receives a score close to zero."""
-    feedback = "This is a product."
-    score = SentimentAnalyzer.analyze(feedback)
-    
-    # Neutral feedback should be close to zero (within reasonable range)
-    assert -0.3 <= score <= 0.3, f"Expected neutral score close to 0, got {score}"
-
-
-def test_very_short_feedback():
-    """Test that very short feedback (< 3 words) is still analyzed."""
-    feedback = "Great!"
-    score = SentimentAnalyzer.analyze(feedback)
-    
-    # Should still return a valid score
+    # Should always return a valid score
     assert -1.0 <= score <= 1.0, f"Score should be in valid range, got {score}"
-    # "Great" should be positive
-    assert score > 0, f"Expected positive score for 'Great!', got {score}"
+    
+    if expected == "positive":
+        assert score > 0, f"Expected positive score for {feedback!r}, got {score}"
+    elif expected == "negative":
+        assert score < 0, f"Expected negative score for {feedback!r}, got {score}"
+    else:
+        # Neutral feedback should be close to zero (within reasonable range)
+        assert -0.3 <= score <= 0.3, f"Expected neutral score close to 0 for {feedback!r}, got {score}"
 
 
 def test_feedback_with_negations():
@@ -75,3 +63,140 @@ def test_get_polarity_score_method():
     
     assert score_from_analyze == score_from_polarity, \
         "analyze() and get_polarity_score() should return the same value"
+
+
+def test_analyze_batch_matches_analyze():
+    """Test that analyze_batch returns the same scores as analyze, in order."""
+    feedbacks = ["This is excellent!", "This is terrible!", "This is a product."]
+    
+    scores = SentimentAnalyzer.analyze_batch(feedbacks)
+    
+    assert scores == [SentimentAnalyzer.analyze(f) for f in feedbacks], \
+        "analyze_batch() should match analyze() for each entry"
+
+
+def test_analyze_batch_with_workers_preserves_order():
+    """Test that analyze_batch returns the same ordered scores across worker processes."""
+    feedbacks = [
+        f"{text} #{i}"
+        for i in range(50)
+        for text in ("This is excellent!", "This is terrible!", "This is a product.")
+    ]
+    
+    scores = SentimentAnalyzer.analyze_batch(feedbacks, workers=2)
+    
+    assert scores == SentimentAnalyzer.analyze_batch(feedbacks), \
+        "Parallel analysis should match single-process analysis"
+
+
+def test_analyze_batch_with_workers_scores_duplicates():
+    """Test that repeated entries get the same score as every other occurrence."""
+    feedbacks = ["This is excellent!", "This is terrible!", "This is a product."] * 50
+    
+    scores = SentimentAnalyzer.analyze_batch(feedbacks, workers=2)
+    
+    assert scores == [SentimentAnalyzer.analyze(feedback) for feedback in feedbacks]
+
+
+def test_get_polarity_score_is_memoized():
+    """Test that repeated feedback is served from the polarity cache."""
+    SentimentAnalyzer.get_polarity_score.cache_clear()
+    
+    first = SentimentAnalyzer.get_polarity_score("Great service, would recommend")
+    second = SentimentAnalyzer.get_polarity_score("Great service, would recommend")
+    
+    assert first == second
+    cache_info = SentimentAnalyzer.get_polarity_score.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
+def test_warmup_loads_lexicon():
+    """Test that warmup loads the sentiment lexicon without needing feedback."""
+    # Run in a fresh interpreter, since the session warmup fixture has already
+    # loaded the lexicon here. dict.__len__ reads the entries without
+    # triggering the lexicon's own lazy load, as len() would.
+    code = (
+        "import feedback_analyzer\n"
+        "lazy_scorer = feedback_analyzer.pattern_sentiment\n"
+        "feedback_analyzer.SentimentAnalyzer().warmup()\n"
+        "assert feedback_analyzer.pattern_sentiment is not lazy_scorer\n"
+        "assert dict.__len__(feedback_analyzer.pattern_sentiment) > 0\n"
+    )
+    
+    subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parent.parent), check=True)
+
+
+def test_sentiment_cache_round_trip(tmp_path):
+    """Test that scores stored in a SentimentCache persist across connections."""
+    cache_path = str(tmp_path / "cache.db")
+    
+    with SentimentCache(cache_path) as cache:
+        assert cache.get_many(["Great!", "Awful!"]) == {}
+        cache.put_many(["Great!", "Awful!"], [1.0, -1.0])
+    
+    with SentimentCache(cache_path) as cache:
+        assert cache.get_many(["Great!", "Awful!", "Unknown"]) == {"Great!": 1.0, "Awful!": -1.0}
+
+
+def test_sentiment_cache_discards_scores_from_another_scorer(tmp_path):
+    """Test that scores recorded under a different scorer version are not reused."""
+    cache_path = str(tmp_path / "cache.db")
+    with SentimentCache(cache_path) as cache:
+        cache.put_many(["Great!"], [1.0])
+    
+    connection = sqlite3.connect(cache_path)
+    with connection:
+        connection.execute("UPDATE meta SET value = '0/textblob-0.0' WHERE name = 'scorer'")
+    connection.close()
+    
+    with SentimentCache(cache_path) as cache:
+        assert cache.get_many(["Great!"]) == {}
+        cache.put_many(["Great!"], [1.0])
+    
+    with SentimentCache(cache_path) as cache:
+        assert cache.get_many(["Great!"]) == {"Great!": 1.0}
+
+
+def test_sentiment_cache_rejects_foreign_cache_table(tmp_path):
+    """Test that a database whose 'cache' table has other columns is refused, not cleared."""
+    cache_path = str(tmp_path / "other.db")
+    connection = sqlite3.connect(cache_path)
+    with connection:
+        connection.execute("CREATE TABLE cache (x TEXT)")
+        connection.execute("INSERT INTO cache (x) VALUES ('keep me')")
+    connection.close()
+    
+    with pytest.raises(sqlite3.DatabaseError):
+        SentimentCache(cache_path)
+    
+    connection = sqlite3.connect(cache_path)
+    assert connection.execute("SELECT x FROM cache").fetchall() == [("keep me",)]
+    connection.close()
+
+
+def test_analyze_batch_with_cache(tmp_path):
+    """Test that analyze_batch fills the cache and serves later batches from it."""
+    feedbacks = ["This is excellent!", "This is terrible!", "This is excellent!"]
+    
+    with SentimentCache(str(tmp_path / "cache.db")) as cache:
+        scores = SentimentAnalyzer.analyze_batch(feedbacks, cache=cache)
+        
+        assert scores == SentimentAnalyzer.analyze_batch(feedbacks)
+        assert cache.get_many(feedbacks) == dict(zip(feedbacks, scores))
+        
+        # A stored score, even a wrong one, is returned without re-analysis
+        cache.put_many(["This is excellent!"], [0.5])
+        assert SentimentAnalyzer.analyze_batch(feedbacks, cache=cache) == [0.5, scores[1], 0.5]
+
+
+def test_textblob_is_imported_on_first_use():
+    """Test that importing the module does not import textblob until analysis runs."""
+    code = (
+        "import sys, feedback_analyzer\n"
+        "assert 'textblob' not in sys.modules\n"
+        "feedback_analyzer.SentimentAnalyzer.analyze('Great!')\n"
+        "assert 'textblob' in sys.modules\n"
+    )
+    
+    subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parent.parent), check=True)